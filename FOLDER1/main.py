@@ -14,6 +14,7 @@ No test harness.
 Pure engine adapter.
 """
 
+from collections import Counter
 from typing import Dict, Any
 
 from tmep_1401_assessor import (
@@ -102,13 +103,14 @@ def assess_trademark_application(app_dict: Dict[str, Any]) -> Dict[str, Any]:
     reporter = TMEP1401ReportGenerator(application, findings)
     report = reporter.generate_full_report()
 
-    # 4️⃣ Build summary
+    # 4️⃣ Build summary (one pass over the findings for all four tallies)
+    counts = Counter(f.severity for f in findings)
     summary = {
         "total": len(findings),
-        "errors": sum(1 for f in findings if f.severity == "ERROR"),
-        "warnings": sum(1 for f in findings if f.severity == "WARNING"),
-        "info": sum(1 for f in findings if f.severity == "INFO"),
-        "ok": sum(1 for f in findings if f.severity == "OK"),
+        "errors": counts["ERROR"],
+        "warnings": counts["WARNING"],
+        "info": counts["INFO"],
+        "ok": counts["OK"],
     }
 
     return {
@@ -4,6 +4,8 @@ Full 45-class database with keywords, descriptions, and validation data.
 Based on the 12th Edition of the Nice Agreement (current as of Nov 2025).
 """
 
+from operator import itemgetter
+
 # ─────────────────────────────────────────────────────────────────────────────
 # COMPLETE NICE CLASSIFICATION — ALL 45 CLASSES
 # ─────────────────────────────────────────────────────────────────────────────
@@ -683,5 +685,5 @@ def suggest_class_for_keyword(keyword: str) -> list:
         if score > 0:
             suggestions.append((cls_num, cls_info["title"], score))
 
-    suggestions.sort(key=lambda x: x[2], reverse=True)
+    suggestions.sort(key=itemgetter(2), reverse=True)
     return suggestions[:5]  # Top 5 suggestions
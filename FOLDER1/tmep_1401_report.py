@@ -6,6 +6,7 @@ All findings sourced from TMEP1401Assessor unchanged.
 """
 
 from datetime import datetime
+from operator import attrgetter
 from tmep_1401_assessor import AssessmentFinding, TrademarkApplication
 
 
@@ -80,7 +81,7 @@ class TMEP1401ReportGenerator:
 
         classes_str = "  ".join(
             f"Class {c.class_number} ({get_class_info(c.class_number)['title'] if get_class_info(c.class_number) else '?'})"
-            for c in sorted(app.classes, key=lambda x: x.class_number)
+            for c in sorted(app.classes, key=attrgetter("class_number"))
         )
 
         lines = [
@@ -168,7 +169,7 @@ class TMEP1401ReportGenerator:
         from nice_classification_db import get_class_info
         lines = ["\nCLASS-WISE EVALUATION"]
 
-        for cls_entry in sorted(self.app.classes, key=lambda x: x.class_number):
+        for cls_entry in sorted(self.app.classes, key=attrgetter("class_number")):
             info     = get_class_info(cls_entry.class_number)
             title    = info["title"] if info else "Unknown"
             category = info["category"] if info else "?"
@@ -304,11 +305,11 @@ class TMEP1401ReportGenerator:
     @staticmethod
     def _top_finding(findings: list) -> AssessmentFinding | None:
         """Return the single most severe finding from a list."""
-        order = {"ERROR": 0, "WARNING": 1, "INFO": 2, "OK": 3}
         actionable = [f for f in findings if f.severity in ("ERROR", "WARNING")]
         if not actionable:
             return None
-        return sorted(actionable, key=lambda x: order.get(x.severity, 9))[0]
+        # First ERROR if any, else the first WARNING
+        return next((f for f in actionable if f.severity == "ERROR"), actionable[0])
 
 
 # """
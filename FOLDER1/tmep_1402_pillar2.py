@@ -23,15 +23,40 @@ HOW PILLAR 1 FEEDS PILLAR 2:
 """
 
 import re
-from dataclasses import dataclass, asdict, field
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Optional
 
+# Severity levels — interned so the hot counting loop can compare by identity.
+_SEV_ERROR = sys.intern("ERROR")
+_SEV_WARNING = sys.intern("WARNING")
+_SEV_INFO = sys.intern("INFO")
+_SEV_OK = sys.intern("OK")
+
+# §1402.12 — any parenthesis, bracket or brace in the identification
+_BRACKET_ISSUE = "Parentheses or brackets detected. Prohibited under TMEP §1402.12."
+
+
+def _contains_bracket(text: str) -> bool:
+    """Plain substring tests — quicker than a regex or str.translate here."""
+    return ("(" in text or ")" in text or "[" in text or
+            "]" in text or "{" in text or "}" in text)
+
+
+# Optional — class title/category lookup. Resolved once here rather than on
+# every build_pillar1_context_from_dicts() call.
+try:
+    from nice_classification_db import get_class_info as _get_class_info
+except ImportError:
+    _get_class_info = None
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ─── UNCHANGED FROM YOUR ORIGINAL — KEPT VERBATIM ───────────────────────────
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class IdentificationRecord:
     """
     Stores applicant's identification EXACTLY as submitted.
@@ -103,14 +128,11 @@ def build_pillar1_context_from_dicts(class_entry_dict: dict,
     # Try to get class info if nice_classification_db is available
     class_title = ""
     class_category = ""
-    try:
-        from nice_classification_db import get_class_info
-        info = get_class_info(cls_num)
+    if _get_class_info is not None:
+        info = _get_class_info(cls_num)
         if info:
             class_title = info["title"]
             class_category = info["category"]
-    except ImportError:
-        pass
 
     return Pillar1ClassContext(
         class_number=cls_num,
@@ -130,7 +152,7 @@ def build_pillar1_context_from_dicts(class_entry_dict: dict,
 # Added: per-subsection findings list so each check is traceable
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubsectionFinding:
     """A single finding tied to a specific TMEP §1402.xx sub-section."""
     tmep_section: str     # e.g., "§1402.03"
@@ -140,7 +162,7 @@ class SubsectionFinding:
     recommendation: str   # What to do
 
 
-@dataclass
+@dataclass(slots=True)
 class TMEP1402AnalysisResult:
     # ── Your original fields — UNCHANGED ─────────────────────────────────────
     is_definite: bool
@@ -154,6 +176,155 @@ class TMEP1402AnalysisResult:
     pillar1_dependency_note: str = ""  # Notes how Pillar 1 results affected this assessment
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# SHARED FINDINGS — fixed-text results, built once and returned by reference
+# (SubsectionFinding is frozen, so sharing is safe)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_FINDING_1402_02_OK = SubsectionFinding(
+    tmep_section="§1402.02",
+    severity=_SEV_OK,
+    item="Filing date entitlement",
+    finding="Identification appears complete enough to support filing date entitlement.",
+    recommendation="No action required."
+)
+
+_FINDING_1402_03_OK = SubsectionFinding(
+    tmep_section="§1402.03",
+    severity=_SEV_OK,
+    item="Specificity check",
+    finding="No indefinite terms detected. Identification appears sufficiently specific.",
+    recommendation="No action required."
+)
+
+_FINDING_1402_09_OK = SubsectionFinding(
+    tmep_section="§1402.09",
+    severity=_SEV_OK,
+    item="Banned terms check",
+    finding="No prohibited terms ('applicant', 'registrant') found.",
+    recommendation="No action required."
+)
+
+_FINDING_1402_10_OK = SubsectionFinding(
+    tmep_section="§1402.10",
+    severity=_SEV_OK,
+    item="§1(b) identification format",
+    finding="§1(b) identification is stated definitively without future-tense language.",
+    recommendation="No action required. Remember: specimen must be filed with SOU."
+)
+
+_FINDING_1402_12_ERROR = SubsectionFinding(
+    tmep_section="§1402.12",
+    severity=_SEV_ERROR,
+    item="Parentheses/brackets in identification",
+    finding=_BRACKET_ISSUE,
+    recommendation="Remove all parentheses ( ), brackets [ ], and braces { } from "
+                   "the identification. Rewrite any parenthetical clarifications "
+                   "as direct language."
+)
+
+_FINDING_1402_12_OK = SubsectionFinding(
+    tmep_section="§1402.12",
+    severity=_SEV_OK,
+    item="Parentheses/brackets check",
+    finding="No parentheses or brackets found.",
+    recommendation="No action required."
+)
+
+
+# ── §1402.11 decision table ──────────────────────────────────────────────────
+# The services check reduces to three flags; every outcome is a fixed finding,
+# so _check_1402_11 is a single regex scan plus a table lookup.
+
+_SVC_ACTIVITY = 1   # "providing", "services for", ... present
+_SVC_INTERNAL = 2   # "our", "my", "internal", ... present
+_SVC_CATEGORY = 4   # class is a services class (Pillar 1, or "service(s)" in text)
+
+_FINDING_1402_11_NOT_SERVICES = SubsectionFinding(
+    tmep_section="§1402.11",
+    severity=_SEV_INFO,
+    item="§1402.11 services check",
+    finding="This appears to be a goods class. §1402.11 services format "
+            "requirement does not apply.",
+    recommendation="No action required."
+)
+_FINDING_1402_11_INTERNAL = SubsectionFinding(
+    tmep_section="§1402.11",
+    severity=_SEV_ERROR,
+    item="Internal-activity language in service identification",
+    finding="Identification appears to describe the applicant's own internal activities "
+            "rather than services rendered FOR OTHERS. Services must be described "
+            "as activities performed for the benefit of third parties.",
+    recommendation="Rewrite as: 'providing X services for others in the field of Y' "
+                   "or 'X services rendered to others, namely...'"
+)
+_FINDING_1402_11_NO_ACTIVITY = SubsectionFinding(
+    tmep_section="§1402.11",
+    severity=_SEV_WARNING,
+    item="Service identification format",
+    finding="Service identification does not explicitly state the activity is "
+            "rendered for others. Per §1402.11, services must be described as "
+            "activities performed for third parties.",
+    recommendation="Add language such as 'providing', 'rendering', or "
+                   "'offering...for others' to clarify the commercial nature."
+)
+_FINDING_1402_11_OK = SubsectionFinding(
+    tmep_section="§1402.11",
+    severity=_SEV_OK,
+    item="Service activity format",
+    finding="Identification correctly describes a service activity rendered for others.",
+    recommendation="No action required."
+)
+
+# Indexed by the OR of the _SVC_* flags above.
+_TABLE_1402_11 = (
+    _FINDING_1402_11_NOT_SERVICES,   # 0
+    _FINDING_1402_11_NOT_SERVICES,   # ACTIVITY
+    _FINDING_1402_11_NOT_SERVICES,   # INTERNAL
+    _FINDING_1402_11_NOT_SERVICES,   # ACTIVITY | INTERNAL
+    _FINDING_1402_11_NO_ACTIVITY,    # CATEGORY
+    _FINDING_1402_11_OK,             # CATEGORY | ACTIVITY
+    _FINDING_1402_11_INTERNAL,       # CATEGORY | INTERNAL
+    _FINDING_1402_11_INTERNAL,       # CATEGORY | ACTIVITY | INTERNAL
+)
+
+
+@lru_cache(maxsize=64)
+def _finding_1402_05_intent_to_use(class_number: int) -> SubsectionFinding:
+    """§1402.05 result for a §1(b) class — depends only on the class number.
+    Bounded: class numbers come from callers, Nice has 45 classes."""
+    return SubsectionFinding(
+        tmep_section="§1402.05",
+        severity=_SEV_INFO,
+        item=f"Class {class_number} — §1(b) accuracy standard",
+        finding="Intent-to-use application (§1(b)). Identification must accurately "
+                "reflect goods/services applicant has a bona fide intention to use. "
+                "Specimen not yet required — accuracy will be verified at SOU stage.",
+        recommendation="Ensure identification reflects actual intended use. "
+                       "Overly broad identifications may cause problems at SOU stage."
+    )
+
+
+def _finding_1402_05_deferred(class_number: int, error_summary: str) -> SubsectionFinding:
+    """§1402.05 result when Pillar 1 flagged a class ERROR — accuracy is deferred."""
+    return SubsectionFinding(
+        tmep_section="§1402.05",
+        severity=_SEV_WARNING,
+        item=f"Class {class_number} — Accuracy deferred",
+        finding="Pillar 1 detected a classification ERROR for this class. "
+                "Accuracy of identification cannot be confirmed until the class "
+                f"is corrected. Pillar 1 issue: {error_summary[:100]}",
+        recommendation="Resolve Pillar 1 classification errors first, then "
+                       "re-assess identification accuracy in the correct class."
+    )
+
+
+# Reasoning text for a fully clean identification — no warnings, no vague
+# terms, purpose language present, no structural issues.
+_REASONING_CLEAN = ("The identification appears to list particular goods/services "
+                    "with sufficient specificity under TMEP §1402.")
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # TMEP §1402 LENS ENGINE — IMPROVED
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -219,9 +390,28 @@ class TMEP1402Lens:
         r"\bconsulting\b",
     ]
 
+    # ADDED — Single-pass scanner for §1402.11. Mirrors SERVICE_ACTIVITY_PATTERNS
+    # plus the internal-activity patterns; "services for ..." also counts as
+    # service wording since the alternation consumes it first.
+    _SERVICE_SCAN_RE = re.compile(
+        r"(?P<svc_activity>\bservices for\b|\bservices in the (?:nature|field)\b)"
+        r"|(?P<activity>\bproviding\b|\brendering\b|\boffering\b|\bconsulting\b)"
+        r"|(?P<internal>\bour\b|\bmy\b|\bthe company'?s\b|\binternal\b)"
+        r"|(?P<service>\bservice[s]?\b)",
+        re.IGNORECASE
+    )
+    _SERVICE_SCAN_FLAGS = {
+        "svc_activity": _SVC_ACTIVITY | _SVC_CATEGORY,
+        "activity": _SVC_ACTIVITY,
+        "internal": _SVC_INTERNAL,
+        "service": _SVC_CATEGORY,
+    }
+
     def __init__(self, identification_text: str,
                  pillar1_context: Optional[Pillar1ClassContext] = None):
         self.text = identification_text
+        self._text_lower = identification_text.lower()   # shared by §1402.02 / §1402.05
+        self._has_brackets = _contains_bracket(identification_text)
         self.p1 = pillar1_context   # None if running standalone without Pillar 1
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -267,8 +457,8 @@ class TMEP1402Lens:
         and_count = len(re.findall(r"\band\b", self.text, re.IGNORECASE))
         if and_count > 3:
             issues.append("Excessive conjunction stacking ('and') may indicate over-breadth.")
-        if re.search(r"[\(\)\[\]\{\}]", self.text):
-            issues.append("Parentheses or brackets detected. Prohibited under TMEP §1402.12.")
+        if self._has_brackets:
+            issues.append(_BRACKET_ISSUE)
         return issues
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -280,14 +470,14 @@ class TMEP1402Lens:
         if not segments:
             return SubsectionFinding(
                 tmep_section="§1402.01",
-                severity="ERROR",
+                severity=_SEV_ERROR,
                 item="Identification text",
                 finding="Identification is empty or cannot be parsed into distinct goods/services.",
                 recommendation="Provide a clear, itemized list of goods/services separated by semicolons."
             )
         return SubsectionFinding(
             tmep_section="§1402.01",
-            severity="OK",
+            severity=_SEV_OK,
             item=f"{len(segments)} item(s) identified",
             finding=f"Identification contains {len(segments)} item(s): "
                     f"{'; '.join(s[:40] for s in segments[:3])}{'...' if len(segments)>3 else ''}",
@@ -305,12 +495,12 @@ class TMEP1402Lens:
         """
         placeholders = ["tbd", "to be determined", "see attached", "n/a",
                         "[insert]", "xxx", "your goods here"]
-        text_lower = self.text.lower().strip()
+        text_lower = self._text_lower.strip()
 
         if any(p in text_lower for p in placeholders):
             return SubsectionFinding(
                 tmep_section="§1402.02",
-                severity="ERROR",
+                severity=_SEV_ERROR,
                 item="Placeholder text detected",
                 finding="Identification contains placeholder or incomplete text. "
                         "Application will not be entitled to its filing date.",
@@ -320,18 +510,12 @@ class TMEP1402Lens:
         if len(text_lower) < 10:
             return SubsectionFinding(
                 tmep_section="§1402.02",
-                severity="ERROR",
+                severity=_SEV_ERROR,
                 item="Identification too short",
                 finding="Identification is too brief to secure a filing date.",
                 recommendation="Provide a complete identification of goods/services."
             )
-        return SubsectionFinding(
-            tmep_section="§1402.02",
-            severity="OK",
-            item="Filing date entitlement",
-            finding="Identification appears complete enough to support filing date entitlement.",
-            recommendation="No action required."
-        )
+        return _FINDING_1402_02_OK
 
     # ─────────────────────────────────────────────────────────────────────────
     # ADDED — §1402.03: Specificity of terms (uses your original vague detection)
@@ -351,7 +535,7 @@ class TMEP1402Lens:
         if severe_vague:
             return SubsectionFinding(
                 tmep_section="§1402.03",
-                severity="ERROR",
+                severity=_SEV_ERROR,
                 item=f"Indefinite terms: {', '.join(severe_vague)}",
                 finding=f"Severely indefinite terms found: {', '.join(severe_vague)}. "
                         "These are categorically unacceptable under USPTO practice.",
@@ -361,20 +545,14 @@ class TMEP1402Lens:
         if mild_vague:
             return SubsectionFinding(
                 tmep_section="§1402.03",
-                severity="WARNING",
+                severity=_SEV_WARNING,
                 item=f"Potentially vague terms: {', '.join(mild_vague)}",
                 finding=f"Possibly indefinite terms found: {', '.join(mild_vague)}. "
                         "These may be acceptable with additional specificity.",
                 recommendation=f"Review terms: {', '.join(mild_vague)}. "
                                "Add 'namely' clauses to specify exact goods/services."
             )
-        return SubsectionFinding(
-            tmep_section="§1402.03",
-            severity="OK",
-            item="Specificity check",
-            finding="No indefinite terms detected. Identification appears sufficiently specific.",
-            recommendation="No action required."
-        )
+        return _FINDING_1402_03_OK
 
     # ─────────────────────────────────────────────────────────────────────────
     # ADDED — §1402.05: Accuracy — cross-checked against Pillar 1 specimen
@@ -392,7 +570,7 @@ class TMEP1402Lens:
         if not self.p1:
             return SubsectionFinding(
                 tmep_section="§1402.05",
-                severity="INFO",
+                severity=_SEV_INFO,
                 item="Accuracy check (no Pillar 1 context)",
                 finding="No Pillar 1 context provided. Cannot cross-check identification "
                         "accuracy against specimen.",
@@ -401,38 +579,21 @@ class TMEP1402Lens:
 
         # If Pillar 1 already flagged a class ERROR, accuracy check is secondary
         if self.p1.has_pillar1_class_error:
-            return SubsectionFinding(
-                tmep_section="§1402.05",
-                severity="WARNING",
-                item=f"Class {self.p1.class_number} — Accuracy deferred",
-                finding="Pillar 1 detected a classification ERROR for this class. "
-                        "Accuracy of identification cannot be confirmed until the class "
-                        f"is corrected. Pillar 1 issue: {self.p1.pillar1_error_summary[:100]}",
-                recommendation="Resolve Pillar 1 classification errors first, then "
-                               "re-assess identification accuracy in the correct class."
-            )
+            return _finding_1402_05_deferred(self.p1.class_number,
+                                             self.p1.pillar1_error_summary)
 
         # Intent-to-use: no specimen yet, different accuracy standard
         if self.p1.filing_basis == "1(b)":
-            return SubsectionFinding(
-                tmep_section="§1402.05",
-                severity="INFO",
-                item=f"Class {self.p1.class_number} — §1(b) accuracy standard",
-                finding="Intent-to-use application (§1(b)). Identification must accurately "
-                        "reflect goods/services applicant has a bona fide intention to use. "
-                        "Specimen not yet required — accuracy will be verified at SOU stage.",
-                recommendation="Ensure identification reflects actual intended use. "
-                               "Overly broad identifications may cause problems at SOU stage."
-            )
+            return _finding_1402_05_intent_to_use(self.p1.class_number)
 
         # Cross-check identification text against specimen description
-        id_lower = self.text.lower()
+        id_lower = self._text_lower
         spec_lower = self.p1.specimen_description.lower()
 
         if not spec_lower:
             return SubsectionFinding(
                 tmep_section="§1402.05",
-                severity="INFO",
+                severity=_SEV_INFO,
                 item="No specimen description from Pillar 1",
                 finding="Specimen description not available for accuracy cross-check.",
                 recommendation="Provide specimen description in Pillar 1 class entry for full check."
@@ -447,7 +608,7 @@ class TMEP1402Lens:
         if overlap_ratio < 0.1 and len(spec_words) > 3:
             return SubsectionFinding(
                 tmep_section="§1402.05",
-                severity="WARNING",
+                severity=_SEV_WARNING,
                 item="Low overlap between identification and specimen",
                 finding=f"Low conceptual overlap between identification and specimen description "
                         f"(~{int(overlap_ratio*100)}% word overlap). "
@@ -459,7 +620,7 @@ class TMEP1402Lens:
 
         return SubsectionFinding(
             tmep_section="§1402.05",
-            severity="OK",
+            severity=_SEV_OK,
             item="Accuracy vs. specimen",
             finding=f"Identification appears consistent with the specimen provided "
                     f"(~{int(overlap_ratio*100)}% conceptual overlap).",
@@ -483,7 +644,7 @@ class TMEP1402Lens:
         if found_banned:
             return SubsectionFinding(
                 tmep_section="§1402.09",
-                severity="ERROR",
+                severity=_SEV_ERROR,
                 item=f"Banned terms found: {', '.join(found_banned)}",
                 finding=f"The term(s) '{', '.join(found_banned)}' appear in the identification. "
                         "Per §1402.09, 'applicant' and 'registrant' are inappropriate "
@@ -491,13 +652,7 @@ class TMEP1402Lens:
                 recommendation=f"Remove '{', '.join(found_banned)}' from the identification. "
                                "Rewrite the relevant clause without reference to the applicant/registrant."
             )
-        return SubsectionFinding(
-            tmep_section="§1402.09",
-            severity="OK",
-            item="Banned terms check",
-            finding="No prohibited terms ('applicant', 'registrant') found.",
-            recommendation="No action required."
-        )
+        return _FINDING_1402_09_OK
 
     # ─────────────────────────────────────────────────────────────────────────
     # ADDED — §1402.10: §1(b) intent-to-use specific requirements
@@ -516,7 +671,7 @@ class TMEP1402Lens:
         if basis != "1(b)":
             return SubsectionFinding(
                 tmep_section="§1402.10",
-                severity="INFO",
+                severity=_SEV_INFO,
                 item=f"Filing basis: {basis}",
                 finding=f"Application is filed under {basis}, not §1(b). "
                         "§1402.10 intent-to-use requirements do not apply.",
@@ -534,7 +689,7 @@ class TMEP1402Lens:
         if found_future:
             return SubsectionFinding(
                 tmep_section="§1402.10",
-                severity="WARNING",
+                severity=_SEV_WARNING,
                 item="Future-tense language in §1(b) identification",
                 finding="Identification contains future-tense or speculative language "
                         f"({', '.join(found_future)}). Even for §1(b) applications, "
@@ -545,13 +700,7 @@ class TMEP1402Lens:
                                "the identification does not need to reflect it)."
             )
 
-        return SubsectionFinding(
-            tmep_section="§1402.10",
-            severity="OK",
-            item="§1(b) identification format",
-            finding="§1(b) identification is stated definitively without future-tense language.",
-            recommendation="No action required. Remember: specimen must be filed with SOU."
-        )
+        return _FINDING_1402_10_OK
 
     # ─────────────────────────────────────────────────────────────────────────
     # ADDED — §1402.11: Services must be described as activities for others
@@ -564,91 +713,32 @@ class TMEP1402Lens:
         not as internal activities of the applicant.
         
         Uses class_category from Pillar 1 context to determine if this applies.
+        Falls back to detecting service language when there is no Pillar 1 context.
         """
-        # Determine if this is a services class
-        is_services = False
-        if self.p1:
-            is_services = (self.p1.class_category == "SERVICES")
-        else:
-            # Fallback: detect service language if no Pillar 1 context
-            is_services = bool(re.search(r"\bservice[s]?\b", self.text, re.IGNORECASE))
-
-        if not is_services:
-            return SubsectionFinding(
-                tmep_section="§1402.11",
-                severity="INFO",
-                item="§1402.11 services check",
-                finding="This appears to be a goods class. §1402.11 services format "
-                        "requirement does not apply.",
-                recommendation="No action required."
-            )
-
-        # Check for service activity language
-        has_service_activity = any(
-            re.search(p, self.text, re.IGNORECASE)
-            for p in self.SERVICE_ACTIVITY_PATTERNS
-        )
+        # Goods class per Pillar 1 — nothing to scan
+        if self.p1 and self.p1.class_category != "SERVICES":
+            return _FINDING_1402_11_NOT_SERVICES
 
-        # Check for internal-activity framing (bad: "managing our databases")
-        internal_patterns = [r"\bour\b", r"\bmy\b", r"\bthe company'?s\b", r"\binternal\b"]
-        has_internal = any(re.search(p, self.text, re.IGNORECASE) for p in internal_patterns)
-
-        if has_internal:
-            return SubsectionFinding(
-                tmep_section="§1402.11",
-                severity="ERROR",
-                item="Internal-activity language in service identification",
-                finding="Identification appears to describe the applicant's own internal activities "
-                        "rather than services rendered FOR OTHERS. Services must be described "
-                        "as activities performed for the benefit of third parties.",
-                recommendation="Rewrite as: 'providing X services for others in the field of Y' "
-                               "or 'X services rendered to others, namely...'"
-            )
+        flags = 0
+        for m in self._SERVICE_SCAN_RE.finditer(self.text):
+            flags |= self._SERVICE_SCAN_FLAGS[m.lastgroup]
+        if self.p1:
+            flags |= _SVC_CATEGORY
 
-        if not has_service_activity:
-            return SubsectionFinding(
-                tmep_section="§1402.11",
-                severity="WARNING",
-                item="Service identification format",
-                finding="Service identification does not explicitly state the activity is "
-                        "rendered for others. Per §1402.11, services must be described as "
-                        "activities performed for third parties.",
-                recommendation="Add language such as 'providing', 'rendering', or "
-                               "'offering...for others' to clarify the commercial nature."
-            )
-
-        return SubsectionFinding(
-            tmep_section="§1402.11",
-            severity="OK",
-            item="Service activity format",
-            finding="Identification correctly describes a service activity rendered for others.",
-            recommendation="No action required."
-        )
+        return _TABLE_1402_11[flags]
 
     # ─────────────────────────────────────────────────────────────────────────
     # ADDED — §1402.12: Parentheses/Brackets (your original detect, now mapped)
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _check_1402_12(self, structural_issues: List[str]) -> SubsectionFinding:
-        """§1402.12 — Parentheses and brackets are prohibited."""
-        bracket_issues = [i for i in structural_issues if "Parentheses" in i or "brackets" in i]
-        if bracket_issues:
-            return SubsectionFinding(
-                tmep_section="§1402.12",
-                severity="ERROR",
-                item="Parentheses/brackets in identification",
-                finding=bracket_issues[0],
-                recommendation="Remove all parentheses ( ), brackets [ ], and braces { } from "
-                               "the identification. Rewrite any parenthetical clarifications "
-                               "as direct language."
-            )
-        return SubsectionFinding(
-            tmep_section="§1402.12",
-            severity="OK",
-            item="Parentheses/brackets check",
-            finding="No parentheses or brackets found.",
-            recommendation="No action required."
-        )
+    def _check_1402_12(self) -> SubsectionFinding:
+        """
+        §1402.12 — Parentheses and brackets are prohibited.
+        Uses the bracket scan done once in __init__.
+        """
+        if self._has_brackets:
+            return _FINDING_1402_12_ERROR
+        return _FINDING_1402_12_OK
 
     # ─────────────────────────────────────────────────────────────────────────
     # MAIN EVALUATE METHOD — YOUR ORIGINAL STRUCTURE + SUBSECTION INTEGRATION
@@ -661,50 +751,56 @@ class TMEP1402Lens:
         vague_found = self.detect_vague_terms()
         structural_flags = self.detect_structural_issues()
 
-        # ── Run all per-subsection checks ─────────────────────────────────────
-        findings = [
+        # Pillar 1 class ERROR → _check_1402_05 returns a "deferred" warning
+        # instead of cross-checking the specimen; the other checks run as usual.
+        p1_class_error = self.p1 is not None and self.p1.has_pillar1_class_error
+
+        # ── Run all per-subsection checks, tallying severities as we go ──────
+        findings = []
+        error_count = warning_count = 0
+        for f in (
             self._check_1402_01(goods_segments),
             self._check_1402_02(goods_segments),
             self._check_1402_03(vague_found),
-            self._check_1402_05(),        # ← uses Pillar 1 context
+            self._check_1402_05(),        # ← uses Pillar 1 context (deferred on P1 class ERROR)
             self._check_1402_09(),
             self._check_1402_10(),        # ← uses Pillar 1 filing_basis
             self._check_1402_11(),        # ← uses Pillar 1 class_category
-            self._check_1402_12(structural_flags),
-        ]
+            self._check_1402_12(),
+        ):
+            findings.append(f)
+            if f.severity is _SEV_ERROR:
+                error_count += 1
+            elif f.severity is _SEV_WARNING:
+                warning_count += 1
 
         # ── CHANGED: is_definite now weighted, not all-or-nothing ────────────
-        error_count = sum(1 for f in findings if f.severity == "ERROR")
-        warning_count = sum(1 for f in findings if f.severity == "WARNING")
         is_definite = (error_count == 0)   # Only hard errors block definiteness
 
         # ── Build reasoning (your original structure, now using subsection findings) ──
-        reasoning_parts = []
-        if is_definite and warning_count == 0:
-            reasoning_parts.append(
-                "The identification appears to list particular goods/services "
-                "with sufficient specificity under TMEP §1402."
-            )
-        elif is_definite and warning_count > 0:
-            reasoning_parts.append(
-                "The identification meets minimum §1402 standards but has "
-                f"{warning_count} warning(s) that should be addressed."
-            )
+        if (is_definite and warning_count == 0 and purpose_flag
+                and not vague_found and not structural_flags):
+            reasoning = _REASONING_CLEAN   # common clean case — nothing to join
         else:
-            reasoning_parts.append(
-                "The identification does not sufficiently identify particular goods/services "
-                f"as required by TMEP §1402. {error_count} error(s) must be corrected."
-            )
-
-        if vague_found:
-            reasoning_parts.append(f"Vague terminology: {', '.join(vague_found)}.")
-        if not purpose_flag:
-            reasoning_parts.append(
+            if is_definite and warning_count == 0:
+                headline = _REASONING_CLEAN
+            elif is_definite and warning_count > 0:
+                headline = ("The identification meets minimum §1402 standards but has "
+                            f"{warning_count} warning(s) that should be addressed.")
+            else:
+                headline = ("The identification does not sufficiently identify particular "
+                            "goods/services as required by TMEP §1402. "
+                            f"{error_count} error(s) must be corrected.")
+
+            # Absent pieces are None and dropped by filter() — one tuple, one join
+            reasoning = " ".join(filter(None, (
+                headline,
+                f"Vague terminology: {', '.join(vague_found)}." if vague_found else None,
+                None if purpose_flag else
                 "No explicit commercial purpose qualifier detected "
-                "(may be required depending on class)."
-            )
-        if structural_flags:
-            reasoning_parts.extend(structural_flags)
+                "(may be required depending on class).",
+                *structural_flags,
+            )))
 
         # ── Pillar 1 dependency note ──────────────────────────────────────────
         p1_note = ""
@@ -715,7 +811,7 @@ class TMEP1402Lens:
                 f"as determined by Pillar 1. "
                 f"Filing basis: {self.p1.filing_basis}. "
             )
-            if self.p1.has_pillar1_class_error:
+            if p1_class_error:
                 p1_note += (
                     "⚠️ Pillar 1 flagged a classification ERROR — some Pillar 2 "
                     "checks are deferred until class is corrected."
@@ -729,12 +825,39 @@ class TMEP1402Lens:
             purpose_detected=purpose_flag,
             vague_terms_found=vague_found,
             structural_issues=structural_flags,
-            reasoning=" ".join(reasoning_parts),
+            reasoning=reasoning,
             subsection_findings=findings,
             pillar1_dependency_note=p1_note
         )
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# SERIALIZATION — plain-dict form of the result (field-for-field, no asdict())
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _finding_to_dict(f: SubsectionFinding) -> Dict:
+    return {
+        "tmep_section": f.tmep_section,
+        "severity": f.severity,
+        "item": f.item,
+        "finding": f.finding,
+        "recommendation": f.recommendation,
+    }
+
+
+def _result_to_dict(result: TMEP1402AnalysisResult) -> Dict:
+    return {
+        "is_definite": result.is_definite,
+        "identified_goods_services": list(result.identified_goods_services),
+        "purpose_detected": result.purpose_detected,
+        "vague_terms_found": list(result.vague_terms_found),
+        "structural_issues": list(result.structural_issues),
+        "reasoning": result.reasoning,
+        "subsection_findings": [_finding_to_dict(f) for f in result.subsection_findings],
+        "pillar1_dependency_note": result.pillar1_dependency_note,
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PUBLIC API — UNCHANGED SIGNATURE + OVERLOAD WITH PILLAR 1 CONTEXT
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -766,13 +889,16 @@ def analyze_identification_under_tmep_1402(identification_text: str,
     lens = TMEP1402Lens(verbatim, pillar1_context=pillar1_context)
     result = lens.evaluate()
 
-    analysis_dict = asdict(result)
+    analysis_dict = _result_to_dict(result)
+    counts = {"ERROR": 0, "WARNING": 0, "INFO": 0, "OK": 0}
+    for f in result.subsection_findings:
+        counts[f.severity] = counts.get(f.severity, 0) + 1
     summary = {
         "total_findings": len(result.subsection_findings),
-        "errors": sum(1 for f in result.subsection_findings if f.severity == "ERROR"),
-        "warnings": sum(1 for f in result.subsection_findings if f.severity == "WARNING"),
-        "info": sum(1 for f in result.subsection_findings if f.severity == "INFO"),
-        "ok": sum(1 for f in result.subsection_findings if f.severity == "OK"),
+        "errors": counts["ERROR"],
+        "warnings": counts["WARNING"],
+        "info": counts["INFO"],
+        "ok": counts["OK"],
         "is_definite": result.is_definite,
     }
 
@@ -787,21 +913,24 @@ def analyze_identification_under_tmep_1402(identification_text: str,
 # REPORT PRINTER — ADDED for readable output
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def print_pillar2_report(result_dict: Dict, class_number: int = 0):
-    """Professional legal report — Pillar 2 identification assessment."""
-    _SEV = {"ERROR": "■", "WARNING": "▲", "INFO": "◆", "OK": "✓"}
+_SEVERITY_SYMBOLS = {"ERROR": "■", "WARNING": "▲", "INFO": "◆", "OK": "✓"}
+_REPORT_RULE = "─" * 70
+
+
+def _trim(t, n=110):
+    """Single-line, word-boundary truncation for the report."""
+    t = str(t).replace("\n", " ").strip()
+    return t if len(t) <= n else t[:n].rsplit(" ", 1)[0] + "…"
 
-    def _trim(t, n=110):
-        t = str(t).replace("\n", " ").strip()
-        return t if len(t) <= n else t[:n].rsplit(" ", 1)[0] + "…"
 
+def print_pillar2_report(result_dict: Dict, class_number: int = 0):
+    """Professional legal report — Pillar 2 identification assessment."""
     analysis = result_dict["tmep_1402_analysis"]
     summary  = result_dict["summary"]
     label    = f"Class {class_number}" if class_number else "Identification"
     status   = "DEFINITE" if summary["is_definite"] else "NOT DEFINITE — REQUIRES AMENDMENT"
 
-    line = "─" * 70
-    print(f"\n{line}")
+    print(f"\n{_REPORT_RULE}")
     print(f"  IDENTIFICATION REVIEW  |  {label}  |  §1402")
     print(f"  Status: {status}")
 
@@ -812,7 +941,7 @@ def print_pillar2_report(result_dict: Dict, class_number: int = 0):
     if issues:
         print(f"\n  Issues Identified:")
         for f in issues:
-            sym = _SEV.get(f["severity"], "?")
+            sym = _SEVERITY_SYMBOLS.get(f["severity"], "?")
             print(f"  {sym} [{f['tmep_section']}]  {_trim(f['finding'])}")
             print(f"      → {_trim(f['recommendation'])}")
     else:
@@ -823,7 +952,7 @@ def print_pillar2_report(result_dict: Dict, class_number: int = 0):
     if "ERROR" in p1_note or "⚠" in p1_note:
         print(f"\n  Note:  {_trim(p1_note, 120)}")
 
-    print(line)
+    print(_REPORT_RULE)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
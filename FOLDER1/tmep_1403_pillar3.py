@@ -49,11 +49,104 @@ HOW PILLARS 1 AND 2 FEED PILLAR 3:
   - Combined P1+P2 status    → §1403.03 division eligibility logic
 """
 
-from dataclasses import dataclass, field, asdict
+import heapq
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 from typing import List, Dict, Optional
 from enum import Enum
 
 
+# Severity levels, §1403 section tags and Pillar 1/2 trigger tags stamped on
+# every Pillar3Finding — interned once so findings share one str object each.
+_SEV_ERROR = sys.intern("ERROR")
+_SEV_WARNING = sys.intern("WARNING")
+_SEV_INFO = sys.intern("INFO")
+_SEV_OK = sys.intern("OK")
+
+_SEC_1403 = sys.intern("§1403")
+_SEC_1403_01 = sys.intern("§1403.01")
+_SEC_1403_02 = sys.intern("§1403.02")
+_SEC_1403_03 = sys.intern("§1403.03")
+_SEC_1403_04 = sys.intern("§1403.04")
+_SEC_1403_05 = sys.intern("§1403.05")
+_SEC_1403_06 = sys.intern("§1403.06")
+
+_TB_P1_IDENT = sys.intern("P1:ClassEntry.identification")
+_TB_P1_FEE = sys.intern("P1:§1401.04")
+_TB_P1_SPEC = sys.intern("P1:§1401.06")
+_TB_P1_CLASS = sys.intern("P1:§1401.03")
+_TB_P1_DATES = sys.intern("P1:ClassEntry.date_of_first_use")
+_TB_P2_DEF = sys.intern("P2:§1402.03")
+
+# The one recommendation shared by every passing check.
+_REC_NO_ACTION = sys.intern("No action required.")
+
+
+# Pillar 1 error-message categories, one bit each. Every message is scanned
+# once (lowercased) when its ClassSummary is built; the §1403 checks then test
+# bits instead of rescanning the text.
+_P1_SPECIMEN = 1
+_P1_CLASSIFICATION = 2
+_P1_FEE = 4
+_P1_DATE = 8
+
+_P1_CATEGORY_RE = re.compile(
+    r"(?P<specimen>specimen)"
+    r"|(?P<classification>misclassif|reclassif|class|wrong|incorrect)"
+    r"|(?P<fee>fee)"
+    r"|(?P<date>date)"
+)
+_P1_CATEGORY_BITS = {
+    "specimen": _P1_SPECIMEN,
+    "classification": _P1_CLASSIFICATION,
+    "fee": _P1_FEE,
+    "date": _P1_DATE,
+}
+
+
+def _p1_message_mask(message: str) -> int:
+    """Category bits for one Pillar 1 error message."""
+    mask = 0
+    for m in _P1_CATEGORY_RE.finditer(message.lower()):
+        mask |= _P1_CATEGORY_BITS[m.lastgroup]
+    return mask
+
+
+# Optional — class title/category lookup. Resolved once here rather than on
+# every build_class_summary() call.
+try:
+    from nice_classification_db import get_class_info as _get_class_info
+except ImportError:
+    _get_class_info = None
+
+
+# Optional — Pillars 1 and 2, chained by run_full_pipeline(). Resolved once
+# here rather than on every pipeline run.
+try:
+    from main import assess_trademark_application as _assess_pillar1
+except ImportError:
+    _assess_pillar1 = None
+
+try:
+    from tmep_1402_pillar2 import (
+        analyze_identification_under_tmep_1402 as _analyze_pillar2,
+        build_pillar1_context_from_dicts as _build_p1_context,
+    )
+except ImportError:
+    _analyze_pillar2 = None
+    _build_p1_context = None
+
+
+@lru_cache(maxsize=64)
+def _cached_class_info(cls_num: int) -> Optional[dict]:
+    """get_class_info() memoized by class number (only 45 Nice classes)."""
+    return _get_class_info(cls_num)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ENUMS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -83,14 +176,15 @@ class ApplicationStage(Enum):
 # BRIDGE — Consolidated Per-Class Context from Pillars 1 and 2
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassSummary:
     """
     Single source of truth for one class, consolidating
     Pillar 1 ClassEntry data + Pillar 1 findings + Pillar 2 results.
 
     Build one ClassSummary per class, then pass the full list to
-    Pillar3Assessor.
+    Pillar3Assessor. Frozen, because the P1 message masks and word caches are
+    computed from the fields once — use dataclasses.replace() to change one.
     """
     # ── Identity (from Pillar 1 ClassEntry) ──────────────────────────────────
     class_number: int
@@ -118,6 +212,26 @@ class ClassSummary:
     # ── Computed Status (set by build_class_summary) ──────────────────────────
     status: ClassStatus = ClassStatus.CLEAN
 
+    # ── Derived (set in __post_init__) ────────────────────────────────────────
+    p1_message_masks: List[int] = field(init=False, repr=False, compare=False)
+    p1_category_mask: int = field(init=False, repr=False, compare=False)
+    _id_words: Optional[frozenset] = field(default=None, init=False, repr=False,
+                                           compare=False)
+    _id_terms: Optional[frozenset] = field(default=None, init=False, repr=False,
+                                           compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        set_ = object.__setattr__
+
+        # Categorised once here; the §1403.01 checks test these bits
+        masks = [_p1_message_mask(m) for m in self.p1_error_messages]
+        mask = 0
+        for mk in masks:
+            mask |= mk
+        set_(self, "p1_message_masks", masks)
+        set_(self, "p1_category_mask", mask)
+
     def has_any_error(self) -> bool:
         return self.p1_error_count > 0 or self.p2_error_count > 0
 
@@ -130,15 +244,83 @@ class ClassSummary:
     def is_intent_to_use(self) -> bool:
         return self.filing_basis == "1(b)"
 
+    def identification_words(self) -> frozenset:
+        """Lowercased identification words — split on first use, then cached."""
+        if self._id_words is None:
+            object.__setattr__(self, "_id_words",
+                               frozenset(self.identification.lower().split()))
+        return self._id_words
+
+    def identification_terms(self) -> frozenset:
+        """identification_words() minus _ID_STOPWORDS — also cached."""
+        if self._id_terms is None:
+            object.__setattr__(self, "_id_terms",
+                               self.identification_words() - _ID_STOPWORDS)
+        return self._id_terms
+
+
+# Filler words ignored when comparing identifications across classes
+# (§1403.02 amendment conflicts, §1403.06 surrender overlap)
+_ID_STOPWORDS = frozenset((
+    "and", "or", "for", "the", "of", "in", "a", "an",
+    "to", "with", "by", "from", "on", "at"
+))
+_SURRENDER_STOPWORDS = _ID_STOPWORDS | frozenset(("namely", "including"))
+
+
+# §1403.02 broadening guard — amendment wording that suggests adding scope.
+# Plain substring alternation ("add" also covers "adding"/"additional").
+_BROADENING_RE = re.compile(
+    r"add|expand|include|broader|new goods|new services|new class"
+)
+
+
+def _finding_field(f, key):
+    """Read a field from a Pillar 1 finding given as a dict or an object."""
+    return f[key] if isinstance(f, dict) else getattr(f, key, None)
+
+
+_EMPTY_P1_BUCKET = {"errors": (), "warnings": 0}
+
+
+def bucket_p1_findings(p1_findings: list) -> Dict[int, dict]:
+    """
+    Group Pillar 1 findings by class_number in a single pass.
+
+    Returns {class_number: {"errors": [(position, finding), ...], "warnings": int}}.
+    Position is the finding's index in p1_findings, so per-class error order
+    can be restored when the application-level bucket (class 0) is merged in.
+    Build once per application and pass to build_class_summary(p1_buckets=...).
+    """
+    buckets: Dict[int, dict] = {}
+    for pos, f in enumerate(p1_findings):
+        # One dict-or-object check per finding, shared by both field reads
+        is_dict = isinstance(f, dict)
+        severity = f["severity"] if is_dict else getattr(f, "severity", None)
+        if severity != "ERROR" and severity != "WARNING":
+            continue
+        cls_num = f["class_number"] if is_dict else getattr(f, "class_number", None)
+        bucket = buckets.get(cls_num)
+        if bucket is None:
+            bucket = buckets[cls_num] = {"errors": [], "warnings": 0}
+        if severity == "ERROR":
+            bucket["errors"].append((pos, f))
+        else:
+            bucket["warnings"] += 1
+    return buckets
+
 
 def build_class_summary(class_entry_dict: dict,
                          p1_findings: list,
-                         p2_result_dict: Optional[dict] = None) -> ClassSummary:
+                         p2_result_dict: Optional[dict] = None,
+                         p1_buckets: Optional[Dict[int, dict]] = None) -> ClassSummary:
     """
     Build a ClassSummary by combining:
       - class_entry_dict: raw class data (from Pillar 1 ClassEntry or plain dict)
       - p1_findings: list of Pillar 1 AssessmentFinding objects or dicts
       - p2_result_dict: optional output dict from analyze_identification_under_tmep_1402()
+      - p1_buckets: optional bucket_p1_findings(p1_findings) result; pass it when
+                    summarising several classes so p1_findings is scanned only once
 
     Example:
         summary = build_class_summary(
@@ -153,27 +335,24 @@ def build_class_summary(class_entry_dict: dict,
     class_title = class_entry_dict.get("class_title", "")
     class_category = class_entry_dict.get("class_category", "")
 
-    if not class_title or not class_category:
-        try:
-            from nice_classification_db import get_class_info
-            info = get_class_info(cls_num)
-            if info:
-                class_title = class_title or info["title"]
-                class_category = class_category or info["category"]
-        except ImportError:
-            pass
-
-    # ── Pull Pillar 1 findings for this class ─────────────────────────────────
-    def _get(f, key):
-        return f[key] if isinstance(f, dict) else getattr(f, key, None)
-
-    cls_p1_findings = [
-        f for f in p1_findings
-        if _get(f, "class_number") == cls_num or _get(f, "class_number") == 0
-    ]
-    p1_errors = [f for f in cls_p1_findings if _get(f, "severity") == "ERROR"]
-    p1_warnings = [f for f in cls_p1_findings if _get(f, "severity") == "WARNING"]
-    p1_error_msgs = [str(_get(f, "finding"))[:100] for f in p1_errors[:3]]
+    if (not class_title or not class_category) and _get_class_info is not None:
+        info = _cached_class_info(cls_num)
+        if info:
+            class_title = class_title or info["title"]
+            class_category = class_category or info["category"]
+
+    # ── Pull Pillar 1 findings for this class (+ application-level class 0) ───
+    if p1_buckets is None:
+        p1_buckets = bucket_p1_findings(p1_findings)
+    own = p1_buckets.get(cls_num, _EMPTY_P1_BUCKET)
+    app_level = p1_buckets.get(0, _EMPTY_P1_BUCKET) if cls_num != 0 else _EMPTY_P1_BUCKET
+
+    p1_error_count = len(own["errors"]) + len(app_level["errors"])
+    p1_warning_count = own["warnings"] + app_level["warnings"]
+    # Messages are truncated here, once; the §1403 checks use them as-is.
+    # Positions are unique, so the merge never compares the findings themselves
+    p1_error_msgs = [str(_finding_field(f, "finding"))[:100]
+                     for _, f in islice(heapq.merge(own["errors"], app_level["errors"]), 3)]
 
     # ── Pull Pillar 2 findings ────────────────────────────────────────────────
     p2_is_definite = True
@@ -192,8 +371,8 @@ def build_class_summary(class_entry_dict: dict,
                 p2_error_msgs.append(sf.get("finding", "")[:100])
 
     # ── Compute status ────────────────────────────────────────────────────────
-    total_errors = len(p1_errors) + p2_errors
-    total_warnings = len(p1_warnings) + p2_warnings
+    total_errors = p1_error_count + p2_errors
+    total_warnings = p1_warning_count + p2_warnings
 
     if total_errors >= 3:
         status = ClassStatus.REFUSAL_CANDIDATE
@@ -215,8 +394,8 @@ def build_class_summary(class_entry_dict: dict,
         date_of_first_use=class_entry_dict.get("date_of_first_use"),
         date_of_first_use_commerce=class_entry_dict.get("date_of_first_use_commerce"),
         fee_paid=class_entry_dict.get("fee_paid", True),
-        p1_error_count=len(p1_errors),
-        p1_warning_count=len(p1_warnings),
+        p1_error_count=p1_error_count,
+        p1_warning_count=p1_warning_count,
         p1_error_messages=p1_error_msgs,
         p2_is_definite=p2_is_definite,
         p2_error_count=p2_errors,
@@ -230,7 +409,7 @@ def build_class_summary(class_entry_dict: dict,
 # APPLICATION-LEVEL CONTEXT (carries fee + stage info across all classes)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class MultiClassApplicationContext:
     """
     Application-level context for the multi-class assessment.
@@ -263,9 +442,9 @@ class MultiClassApplicationContext:
 # FINDING MODEL
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Pillar3Finding:
-    """A single finding for one §1403.xx check."""
+    """A single finding for one §1403.xx check (immutable once emitted)."""
     tmep_section: str       # §1403.01 through §1403.06
     severity: str           # ERROR | WARNING | INFO | OK
     class_number: int       # 0 = application-level
@@ -275,8 +454,20 @@ class Pillar3Finding:
     # Cross-pillar link: which P1/P2 finding triggered this
     triggered_by: str = ""  # e.g. "P1:§1401.04", "P2:§1402.03"
 
+    def to_dict(self) -> dict:
+        """Plain-dict form, field-for-field (no asdict() deep copy)."""
+        return {
+            "tmep_section": self.tmep_section,
+            "severity": self.severity,
+            "class_number": self.class_number,
+            "item": self.item,
+            "finding": self.finding,
+            "recommendation": self.recommendation,
+            "triggered_by": self.triggered_by,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class Pillar3AssessmentResult:
     """Complete Pillar 3 output."""
     findings: List[Pillar3Finding] = field(default_factory=list)
@@ -294,6 +485,19 @@ class Pillar3AssessmentResult:
     total_errors: int = 0
     total_warnings: int = 0
 
+    def to_dict(self) -> dict:
+        """Plain-dict form, field-for-field (no asdict() deep copy)."""
+        return {
+            "findings": [f.to_dict() for f in self.findings],
+            "division_eligible_classes": list(self.division_eligible_classes),
+            "division_recommended": self.division_recommended,
+            "partial_refusal_classes": list(self.partial_refusal_classes),
+            "partial_refusal_reasons": dict(self.partial_refusal_reasons),
+            "is_multi_class_compliant": self.is_multi_class_compliant,
+            "total_errors": self.total_errors,
+            "total_warnings": self.total_warnings,
+        }
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PILLAR 3 ASSESSOR
@@ -303,6 +507,10 @@ class Pillar3Assessor:
     """
     Runs all §1403.01–§1403.06 checks on a multi-class application,
     using consolidated ClassSummary objects built from Pillars 1 and 2.
+
+    verbose_ok=False skips the OK/INFO entries of the per-class §1403.01
+    checklist (about five per class). Error/warning counts, compliance and
+    the printed report are unaffected; only result.findings is shorter.
     """
 
     USPTO_FEES = {
@@ -313,9 +521,11 @@ class Pillar3Assessor:
 
     def __init__(self,
                  class_summaries: List[ClassSummary],
-                 app_context: MultiClassApplicationContext):
+                 app_context: MultiClassApplicationContext,
+                 verbose_ok: bool = True):
         self.classes = class_summaries
         self.ctx = app_context
+        self.verbose_ok = verbose_ok
         self.findings: List[Pillar3Finding] = []
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -324,14 +534,35 @@ class Pillar3Assessor:
 
     def run_full_assessment(self) -> Pillar3AssessmentResult:
         """Run all §1403 checks in sequence and return the full result."""
-        self.findings.clear()
+        # Fresh list per run: the returned result holds this list, so it must
+        # not be cleared or refilled by a later run on the same assessor
+        self.findings = []
+
+        # Class-level aggregates shared by the checks below — computed once per run
+        self._class_list = [c.class_number for c in self.classes]
+        self._class_set = frozenset(self._class_list)
+        self._unique_cls_count = len(self._class_set)
+        # First ClassSummary per class number (reversed so the first one wins)
+        self._classes_by_num = {c.class_number: c for c in reversed(self.classes)}
+        # Per-class fee, formatted once for the §1403.01 fee messages
+        self._fee_str = f"${self.USPTO_FEES.get(self.ctx.filing_type, 350)}"
+
+        # Partitions on the precomputed ClassSummary flags, built in one pass
+        # and read by §1403.03 / §1403.05 instead of re-filtering self.classes
+        self._error_classes, self._clean_classes = [], []
+        self._use_based_classes, self._itu_classes = [], []
+        for c in self.classes:
+            (self._error_classes if c.has_any_error() else self._clean_classes).append(c)
+            if c.is_use_based():
+                self._use_based_classes.append(c)
+            elif c.is_intent_to_use():
+                self._itu_classes.append(c)
 
         # Guard: single-class apps don't need §1403 analysis
-        unique_classes = list({c.class_number for c in self.classes})
-        if len(unique_classes) < 2:
+        if self._unique_cls_count < 2:
             self.findings.append(Pillar3Finding(
-                tmep_section="§1403",
-                severity="INFO",
+                tmep_section=_SEC_1403,
+                severity=_SEV_INFO,
                 class_number=0,
                 item="Single-class application",
                 finding="Application contains only one class. "
@@ -349,6 +580,158 @@ class Pillar3Assessor:
 
         return self._build_result(division_eligible, refusal_classes, refusal_reasons)
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # §1403.01 — PER-CLASS CHECKS
+    # Each takes (cls, cls_label, use_based) and returns the finding as
+    # (severity, item, finding, recommendation, triggered_by).
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _check_01_identification(self, cls, cls_label, use_based):
+        # ── CHECK 1: Each class has its own separate identification ───────────
+        if not cls.identification or len(cls.identification.strip()) < 5:
+            return (_SEV_ERROR,
+                    f"{cls_label} — Missing identification",
+                    "No identification of goods/services found for this class. "
+                    "Every class in a multi-class application must have its own "
+                    "separate identification.",
+                    "Provide a complete identification of goods/services "
+                    "for this class.",
+                    _TB_P1_IDENT)
+        if not cls.p2_is_definite:
+            # Pillar 2 found the identification non-definite — surface that here
+            p2_issues = "; ".join(cls.p2_error_messages[:2]) if cls.p2_error_messages else \
+                        "Identification does not meet §1402 specificity standards"
+            return (_SEV_ERROR,
+                    f"{cls_label} — Identification not definite (Pillar 2)",
+                    f"Pillar 2 (§1402) determined the identification for "
+                    f"{cls_label} is NOT sufficiently definite. "
+                    f"Issues: {p2_issues}",
+                    "Amend the identification to meet §1402 specificity "
+                    "requirements before this class can be accepted in "
+                    "a multi-class application.",
+                    _TB_P2_DEF)
+        return (_SEV_OK,
+                f"{cls_label} — Identification",
+                "Separate, definite identification present for this class.",
+                _REC_NO_ACTION,
+                "")
+
+    def _check_01_fee(self, cls, cls_label, use_based):
+        # ── CHECK 2: Each class has its own fee paid (Pillar 1 sets fee_paid) ─
+        if not cls.fee_paid:
+            return (_SEV_ERROR,
+                    f"{cls_label} — Fee not paid",
+                    f"No filing fee was paid for {cls_label}. "
+                    "Every class in a multi-class application requires "
+                    "a separate filing fee.",
+                    f"Submit the per-class fee "
+                    f"({self._fee_str}) "
+                    f"for {cls_label} to avoid deletion of this class.",
+                    _TB_P1_FEE)
+        return (_SEV_OK,
+                f"{cls_label} — Fee",
+                "Fee paid for this class.",
+                _REC_NO_ACTION,
+                "")
+
+    def _check_01_specimen(self, cls, cls_label, use_based):
+        # ── CHECK 3: Each class has its own specimen (use-based) ──────────────
+        if not use_based:
+            return (_SEV_INFO,
+                    f"{cls_label} — Specimen (§1(b))",
+                    f"Intent-to-use basis ({cls.filing_basis}). "
+                    "No specimen required at this stage.",
+                    "Specimen must be submitted with Statement of Use.",
+                    "")
+        if not cls.specimen_type and not cls.specimen_description:
+            return (_SEV_ERROR,
+                    f"{cls_label} — Specimen missing",
+                    f"No specimen provided for {cls_label}. "
+                    "Use-based applications (§1(a)) require a separate "
+                    "specimen for each class showing the mark in actual use.",
+                    "Submit a specimen showing the mark in actual commercial "
+                    "use in connection with the goods/services in this class.",
+                    _TB_P1_SPEC)
+        if cls.p1_error_count > 0 and cls.p1_category_mask & _P1_SPECIMEN:
+            # Pillar 1 already flagged a specimen error — surface it in §1403 context
+            specimen_msgs = "; ".join([m for m, mk in zip(cls.p1_error_messages,
+                                                          cls.p1_message_masks)
+                                       if mk & _P1_SPECIMEN])
+            return (_SEV_ERROR,
+                    f"{cls_label} — Specimen invalid (Pillar 1)",
+                    f"Pillar 1 detected a specimen issue for {cls_label}: "
+                    f"{specimen_msgs[:120]}",
+                    "Replace the specimen with an acceptable one for this class. "
+                    "Each class must have its own valid specimen.",
+                    _TB_P1_SPEC)
+        return (_SEV_OK,
+                f"{cls_label} — Specimen",
+                f"Specimen present: '{cls.specimen_type}'.",
+                _REC_NO_ACTION,
+                "")
+
+    def _check_01_class_assignment(self, cls, cls_label, use_based):
+        # ── CHECK 4: Goods/services correctly assigned to class ───────────────
+        # Pillar 1 §1401.03 errors are the primary signal here
+        if cls.p1_category_mask & _P1_CLASSIFICATION:
+            p1_class_error = next(m for m, mk in zip(cls.p1_error_messages,
+                                                     cls.p1_message_masks)
+                                  if mk & _P1_CLASSIFICATION)
+            return (_SEV_ERROR,
+                    f"{cls_label} — Classification issue (Pillar 1)",
+                    f"Pillar 1 (§1401.03) detected incorrect class assignment for "
+                    f"{cls_label}: {p1_class_error}",
+                    "Correct the class assignment per Pillar 1 recommendations "
+                    "before proceeding with multi-class filing requirements.",
+                    _TB_P1_CLASS)
+        if cls.p1_warning_count > 0:
+            return (_SEV_WARNING,
+                    f"{cls_label} — Class assignment",
+                    f"Pillar 1 raised {cls.p1_warning_count} warning(s) about the "
+                    "class assignment — review recommended.",
+                    "Review Pillar 1 warnings for this class.",
+                    _TB_P1_CLASS)
+        return (_SEV_OK,
+                f"{cls_label} — Class assignment",
+                "No class assignment errors detected for this class.",
+                _REC_NO_ACTION,
+                _TB_P1_CLASS)
+
+    def _check_01_dates_of_use(self, cls, cls_label, use_based):
+        # ── CHECK 5: Dates of use provided per class (use-based) ──────────────
+        if not use_based:
+            return None
+        missing_dates = []
+        if not cls.date_of_first_use:
+            missing_dates.append("date of first use anywhere")
+        if not cls.date_of_first_use_commerce:
+            missing_dates.append("date of first use in commerce")
+
+        if missing_dates:
+            return (_SEV_WARNING,
+                    f"{cls_label} — Missing dates of use",
+                    f"Missing for {cls_label}: {', '.join(missing_dates)}. "
+                    "Per §1403.01, dates of use must be provided separately "
+                    "for each class in a use-based application.",
+                    "Add separate dates of first use (anywhere) and "
+                    "first use in commerce for this class.",
+                    _TB_P1_DATES)
+        return (_SEV_OK,
+                f"{cls_label} — Dates of use",
+                f"First use: {cls.date_of_first_use} | "
+                f"First use in commerce: {cls.date_of_first_use_commerce}",
+                _REC_NO_ACTION,
+                "")
+
+    # Checks 1–5, run in order for every class
+    _CLASS_CHECKS_1403_01 = (
+        _check_01_identification,
+        _check_01_fee,              # ← uses Pillar 1 fee_paid
+        _check_01_specimen,         # ← uses Pillar 1 specimen errors
+        _check_01_class_assignment, # ← uses Pillar 1 §1401.03 errors
+        _check_01_dates_of_use,     # ← uses Pillar 1 filing_basis
+    )
+
     # ─────────────────────────────────────────────────────────────────────────
     # §1403.01 — REQUIREMENTS FOR COMBINED OR MULTIPLE-CLASS APPLICATIONS
     # ─────────────────────────────────────────────────────────────────────────
@@ -362,237 +745,67 @@ class Pillar3Assessor:
           P2 → identification definiteness (is_definite)
           P1 → filing_basis for dates-of-use requirement
         """
-        section = "§1403.01"
-        all_clean = True
+        section = _SEC_1403_01
+        fee_str = self._fee_str     # from run_full_assessment()
+        append = self.findings.append
+        verbose_ok = self.verbose_ok
 
         for cls in self.classes:
             cls_label = f"Class {cls.class_number} ({cls.class_title})"
-
-            # ── CHECK 1: Each class has its own separate identification ───────
-            if not cls.identification or len(cls.identification.strip()) < 5:
-                self.findings.append(Pillar3Finding(
-                    tmep_section=section,
-                    severity="ERROR",
-                    class_number=cls.class_number,
-                    item=f"{cls_label} — Missing identification",
-                    finding="No identification of goods/services found for this class. "
-                             "Every class in a multi-class application must have its own "
-                             "separate identification.",
-                    recommendation="Provide a complete identification of goods/services "
-                                   "for this class.",
-                    triggered_by="P1:ClassEntry.identification"
-                ))
-                all_clean = False
-            elif not cls.p2_is_definite:
-                # Pillar 2 found the identification non-definite — surface that here
-                p2_issues = "; ".join(cls.p2_error_messages[:2]) if cls.p2_error_messages else \
-                            "Identification does not meet §1402 specificity standards"
-                self.findings.append(Pillar3Finding(
-                    tmep_section=section,
-                    severity="ERROR",
-                    class_number=cls.class_number,
-                    item=f"{cls_label} — Identification not definite (Pillar 2)",
-                    finding=f"Pillar 2 (§1402) determined the identification for "
-                             f"{cls_label} is NOT sufficiently definite. "
-                             f"Issues: {p2_issues}",
-                    recommendation="Amend the identification to meet §1402 specificity "
-                                   "requirements before this class can be accepted in "
-                                   "a multi-class application.",
-                    triggered_by="P2:§1402.03"
-                ))
-                all_clean = False
-            else:
-                self.findings.append(Pillar3Finding(
-                    tmep_section=section,
-                    severity="OK",
-                    class_number=cls.class_number,
-                    item=f"{cls_label} — Identification",
-                    finding="Separate, definite identification present for this class.",
-                    recommendation="No action required."
-                ))
-
-            # ── CHECK 2: Each class has its own fee paid ──────────────────────
-            # Pillar 1 sets fee_paid per class
-            if not cls.fee_paid:
-                self.findings.append(Pillar3Finding(
-                    tmep_section=section,
-                    severity="ERROR",
-                    class_number=cls.class_number,
-                    item=f"{cls_label} — Fee not paid",
-                    finding=f"No filing fee was paid for {cls_label}. "
-                             "Every class in a multi-class application requires "
-                             "a separate filing fee.",
-                    recommendation=f"Submit the per-class fee "
-                                   f"(${self.USPTO_FEES.get(self.ctx.filing_type, 350)}) "
-                                   f"for {cls_label} to avoid deletion of this class.",
-                    triggered_by="P1:§1401.04"
-                ))
-                all_clean = False
-            else:
-                self.findings.append(Pillar3Finding(
-                    tmep_section=section,
-                    severity="OK",
-                    class_number=cls.class_number,
-                    item=f"{cls_label} — Fee",
-                    finding="Fee paid for this class.",
-                    recommendation="No action required."
-                ))
-
-            # ── CHECK 3: Each class has its own specimen (use-based) ──────────
-            if cls.is_use_based():
-                if not cls.specimen_type and not cls.specimen_description:
-                    self.findings.append(Pillar3Finding(
-                        tmep_section=section,
-                        severity="ERROR",
-                        class_number=cls.class_number,
-                        item=f"{cls_label} — Specimen missing",
-                        finding=f"No specimen provided for {cls_label}. "
-                                 "Use-based applications (§1(a)) require a separate "
-                                 "specimen for each class showing the mark in actual use.",
-                        recommendation="Submit a specimen showing the mark in actual commercial "
-                                       "use in connection with the goods/services in this class.",
-                        triggered_by="P1:§1401.06"
-                    ))
-                    all_clean = False
-                elif cls.p1_error_count > 0 and any(
-                        "specimen" in m.lower() for m in cls.p1_error_messages):
-                    # Pillar 1 already flagged a specimen error — surface it in §1403 context
-                    self.findings.append(Pillar3Finding(
-                        tmep_section=section,
-                        severity="ERROR",
-                        class_number=cls.class_number,
-                        item=f"{cls_label} — Specimen invalid (Pillar 1)",
-                        finding=f"Pillar 1 detected a specimen issue for {cls_label}: "
-                                 f"{'; '.join(m for m in cls.p1_error_messages if 'specimen' in m.lower())[:120]}",
-                        recommendation="Replace the specimen with an acceptable one for this class. "
-                                       "Each class must have its own valid specimen.",
-                        triggered_by="P1:§1401.06"
-                    ))
-                    all_clean = False
-                else:
-                    self.findings.append(Pillar3Finding(
-                        tmep_section=section,
-                        severity="OK",
-                        class_number=cls.class_number,
-                        item=f"{cls_label} — Specimen",
-                        finding=f"Specimen present: '{cls.specimen_type}'.",
-                        recommendation="No action required."
-                    ))
-            else:
-                self.findings.append(Pillar3Finding(
-                    tmep_section=section,
-                    severity="INFO",
-                    class_number=cls.class_number,
-                    item=f"{cls_label} — Specimen (§1(b))",
-                    finding=f"Intent-to-use basis ({cls.filing_basis}). "
-                             "No specimen required at this stage.",
-                    recommendation="Specimen must be submitted with Statement of Use."
-                ))
-
-            # ── CHECK 4: Goods/services correctly assigned to class ───────────
-            # Pillar 1 §1401.03 errors are the primary signal here
-            p1_class_errors = [m for m in cls.p1_error_messages
-                               if any(kw in m.lower() for kw in
-                                      ["misclassif", "class", "wrong", "incorrect", "reclassif"])]
-
-            if p1_class_errors:
-                self.findings.append(Pillar3Finding(
-                    tmep_section=section,
-                    severity="ERROR",
-                    class_number=cls.class_number,
-                    item=f"{cls_label} — Classification issue (Pillar 1)",
-                    finding=f"Pillar 1 (§1401.03) detected incorrect class assignment for "
-                             f"{cls_label}: {p1_class_errors[0][:120]}",
-                    recommendation="Correct the class assignment per Pillar 1 recommendations "
-                                   "before proceeding with multi-class filing requirements.",
-                    triggered_by="P1:§1401.03"
-                ))
-                all_clean = False
-            else:
-                has_p1_class_warning = cls.p1_warning_count > 0
-                self.findings.append(Pillar3Finding(
+            use_based = cls.is_use_based()
+            for check in self._CLASS_CHECKS_1403_01:
+                t = check(self, cls, cls_label, use_based)
+                if t is None or (not verbose_ok and t[0] not in _ACTIONABLE):
+                    continue
+                severity, item, finding, recommendation, triggered_by = t
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="WARNING" if has_p1_class_warning else "OK",
+                    severity=severity,
                     class_number=cls.class_number,
-                    item=f"{cls_label} — Class assignment",
-                    finding=(f"Pillar 1 raised {cls.p1_warning_count} warning(s) about the "
-                              "class assignment — review recommended."
-                              if has_p1_class_warning else
-                              "No class assignment errors detected for this class."),
-                    recommendation=("Review Pillar 1 warnings for this class."
-                                    if has_p1_class_warning else "No action required."),
-                    triggered_by="P1:§1401.03"
+                    item=item,
+                    finding=finding,
+                    recommendation=recommendation,
+                    triggered_by=triggered_by
                 ))
 
-            # ── CHECK 5: Dates of use provided per class (use-based) ──────────
-            if cls.is_use_based():
-                missing_dates = []
-                if not cls.date_of_first_use:
-                    missing_dates.append("date of first use anywhere")
-                if not cls.date_of_first_use_commerce:
-                    missing_dates.append("date of first use in commerce")
-
-                if missing_dates:
-                    self.findings.append(Pillar3Finding(
-                        tmep_section=section,
-                        severity="WARNING",
-                        class_number=cls.class_number,
-                        item=f"{cls_label} — Missing dates of use",
-                        finding=f"Missing for {cls_label}: {', '.join(missing_dates)}. "
-                                 "Per §1403.01, dates of use must be provided separately "
-                                 "for each class in a use-based application.",
-                        recommendation="Add separate dates of first use (anywhere) and "
-                                       "first use in commerce for this class.",
-                        triggered_by="P1:ClassEntry.date_of_first_use"
-                    ))
-                    all_clean = False
-                else:
-                    self.findings.append(Pillar3Finding(
-                        tmep_section=section,
-                        severity="OK",
-                        class_number=cls.class_number,
-                        item=f"{cls_label} — Dates of use",
-                        finding=f"First use: {cls.date_of_first_use} | "
-                                 f"First use in commerce: {cls.date_of_first_use_commerce}",
-                        recommendation="No action required."
-                    ))
-
         # ── Application-level fee count cross-check ───────────────────────────
         # (Pillar 1 §1401.04 already caught this, but §1403.01 requires us to
         #  confirm fees in the multi-class context specifically)
-        unique_cls_count = len({c.class_number for c in self.classes})
+        unique_cls_count = self._unique_cls_count   # from run_full_assessment()
         fees_paid = self.ctx.fees_paid_count
 
         if fees_paid > 0 and fees_paid != unique_cls_count:
             shortage = unique_cls_count - fees_paid
-            severity = "ERROR" if shortage > 0 else "WARNING"
-            self.findings.append(Pillar3Finding(
+            counts = (f"{fees_paid} fee(s) submitted but "
+                      f"{unique_cls_count} class(es) filed.")
+            if shortage > 0:
+                severity = _SEV_ERROR
+                finding = f"UNDERPAYMENT: {counts} Shortage: {shortage} fee(s)."
+                recommendation = (f"Submit {shortage} additional fee(s) at "
+                                  f"{fee_str}/class. Unpaid classes will be deleted.")
+            else:
+                severity = _SEV_WARNING
+                finding = f"OVERPAYMENT: {counts} Excess: {-shortage} fee(s)."
+                recommendation = "Request refund for excess fees or add additional classes."
+            append(Pillar3Finding(
                 tmep_section=section,
                 severity=severity,
                 class_number=0,
                 item=f"Application-level fee count: {fees_paid} paid, "
                      f"{unique_cls_count} classes",
-                finding=f"{'UNDERPAYMENT' if shortage > 0 else 'OVERPAYMENT'}: "
-                         f"{fees_paid} fee(s) submitted but {unique_cls_count} class(es) filed. "
-                         f"{'Shortage: ' + str(abs(shortage)) + ' fee(s).' if shortage > 0 else 'Excess: ' + str(abs(shortage)) + ' fee(s).'}",
-                recommendation=(
-                    f"Submit {abs(shortage)} additional fee(s) at "
-                    f"${self.USPTO_FEES.get(self.ctx.filing_type, 350)}/class. "
-                    "Unpaid classes will be deleted."
-                    if shortage > 0 else
-                    "Request refund for excess fees or add additional classes."
-                ),
-                triggered_by="P1:§1401.04"
+                finding=finding,
+                recommendation=recommendation,
+                triggered_by=_TB_P1_FEE
             ))
         elif fees_paid > 0:
-            self.findings.append(Pillar3Finding(
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="OK",
+                severity=_SEV_OK,
                 class_number=0,
                 item="Application-level fee count",
                 finding=f"Fee count matches class count: "
                          f"{fees_paid} fee(s) for {unique_cls_count} class(es).",
-                recommendation="No action required."
+                recommendation=_REC_NO_ACTION
             ))
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -610,13 +823,15 @@ class Pillar3Assessor:
 
         Returns: list of class numbers with potential cross-class conflicts.
         """
-        section = "§1403.02"
+        section = _SEC_1403_02
+        append = self.findings.append
+        ctx = self.ctx
         conflict_classes = []
 
-        if not self.ctx.amendment_requested:
-            self.findings.append(Pillar3Finding(
+        if not ctx.amendment_requested:
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="INFO",
+                severity=_SEV_INFO,
                 class_number=0,
                 item="No amendment in this assessment",
                 finding="No amendment has been requested. §1403.02 amendment rules "
@@ -626,18 +841,18 @@ class Pillar3Assessor:
             ))
             return []
 
-        affected = self.ctx.amendment_affects_classes
-        all_class_numbers = [c.class_number for c in self.classes]
+        affected = ctx.amendment_affects_classes
+        all_class_numbers = self._class_list   # from run_full_assessment()
 
         # ── If amendment description says "all classes" or affects all ────────
-        if not affected or set(affected) == set(all_class_numbers):
-            self.findings.append(Pillar3Finding(
+        if not affected or frozenset(affected) == self._class_set:
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="WARNING",
+                severity=_SEV_WARNING,
                 class_number=0,
                 item="Amendment scope: ALL classes",
                 finding=f"The requested amendment appears to affect all classes "
-                         f"({', '.join(f'Class {c}' for c in sorted(all_class_numbers))}). "
+                         f"({', '.join([f'Class {c}' for c in sorted(all_class_numbers)])}). "
                          "An application-wide amendment must be reviewed carefully to ensure "
                          "it does not inadvertently narrow or alter classes that don't need changing.",
                 recommendation="Confirm which classes actually need amendment. "
@@ -646,35 +861,47 @@ class Pillar3Assessor:
             ))
         else:
             # Amendment affects specific classes — check for cross-class conflicts
-            non_affected = [c for c in all_class_numbers if c not in affected]
-
-            for cls in self.classes:
-                if cls.class_number not in affected:
-                    continue
+            affected_set = frozenset(affected)
+
+            # Identification word sets (stopwords removed), split once per class
+            # and partitioned so only amended × non-amended pairs are compared
+            amended_sets, other_classes = [], []
+            word_index: Dict[str, List[int]] = {}   # word → positions in other_classes
+            for c in self.classes:
+                if c.class_number in affected_set:
+                    amended_sets.append((c, c.identification_terms()))
+                else:
+                    pos = len(other_classes)
+                    other_classes.append(c)
+                    for w in c.identification_terms():
+                        word_index.setdefault(w, []).append(pos)
 
+            for cls, amended_words in amended_sets:
                 # Check: does the amended class identification share any keywords
                 # with non-amended classes? (potential overlap after amendment)
-                amended_words = set(cls.identification.lower().split())
-                for other_cls in self.classes:
-                    if other_cls.class_number in affected:
-                        continue
-                    other_words = set(other_cls.identification.lower().split())
-                    shared = amended_words & other_words - {
-                        "and", "or", "for", "the", "of", "in", "a", "an",
-                        "to", "with", "by", "from", "on", "at"
-                    }
-
+                # One sweep over the amended words collects the shared words per
+                # other class; only "3 or more" and the first 5 matter.
+                shared_by_pos: Dict[int, List[str]] = {}
+                for w in amended_words:
+                    for pos in word_index.get(w, ()):
+                        shared = shared_by_pos.setdefault(pos, [])
+                        if len(shared) < 5:
+                            shared.append(w)
+
+                for pos in sorted(shared_by_pos):   # non-amended class order
+                    shared = shared_by_pos[pos]
                     if len(shared) >= 3:
+                        other_cls = other_classes[pos]
                         conflict_classes.append(cls.class_number)
-                        self.findings.append(Pillar3Finding(
+                        append(Pillar3Finding(
                             tmep_section=section,
-                            severity="WARNING",
+                            severity=_SEV_WARNING,
                             class_number=cls.class_number,
                             item=f"Cross-class amendment conflict: "
                                  f"Class {cls.class_number} ↔ Class {other_cls.class_number}",
                             finding=f"Amending Class {cls.class_number} may affect Class "
                                      f"{other_cls.class_number} — they share terminology: "
-                                     f"{', '.join(list(shared)[:5])}. "
+                                     f"{', '.join(shared)}. "
                                      "Per §1403.02, amendments to one class must not "
                                      "inadvertently alter the scope of another.",
                             recommendation=f"Review whether the amendment to Class {cls.class_number} "
@@ -684,33 +911,27 @@ class Pillar3Assessor:
                         ))
 
             if not conflict_classes:
-                self.findings.append(Pillar3Finding(
+                affected_str = ", ".join(map(str, sorted(affected)))
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="OK",
+                    severity=_SEV_OK,
                     class_number=0,
-                    item=f"Amendment scope: Class(es) "
-                         f"{', '.join(str(c) for c in sorted(affected))} only",
-                    finding=f"Amendment is limited to Class(es) "
-                             f"{', '.join(str(c) for c in sorted(affected))}. "
+                    item=f"Amendment scope: Class(es) {affected_str} only",
+                    finding=f"Amendment is limited to Class(es) {affected_str}. "
                              "No obvious cross-class terminology conflicts detected.",
                     recommendation="Ensure the amendment is filed with correct class-specific "
                                    "language and any required additional fees."
                 ))
 
         # ── Amendment broadening guard ────────────────────────────────────────
-        if self.ctx.amendment_description:
-            broadening_keywords = [
-                "add", "adding", "expand", "include", "broader", "additional",
-                "new goods", "new services", "new class"
-            ]
-            desc_lower = self.ctx.amendment_description.lower()
-            if any(kw in desc_lower for kw in broadening_keywords):
-                self.findings.append(Pillar3Finding(
+        if ctx.amendment_description:
+            if _BROADENING_RE.search(ctx.amendment_description.lower()):
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="ERROR",
+                    severity=_SEV_ERROR,
                     class_number=0,
                     item="Amendment may attempt to broaden scope",
-                    finding=f"Amendment description '{self.ctx.amendment_description[:80]}' "
+                    finding=f"Amendment description '{ctx.amendment_description[:80]}' "
                              "contains language suggesting scope broadening. "
                              "Per §1402.07 (applied through §1403.02), amendments cannot "
                              "expand the identification beyond the original filing scope.",
@@ -738,27 +959,29 @@ class Pillar3Assessor:
 
         Returns: list of class numbers eligible/recommended for division.
         """
-        section = "§1403.03"
+        section = _SEC_1403_03
+        append = self.findings.append
         division_eligible = []
 
         # Classes with errors that would benefit from division
-        error_classes = [c for c in self.classes if c.has_any_error()]
-        clean_classes = [c for c in self.classes if not c.has_any_error()]
+        error_classes = self._error_classes        # from run_full_assessment()
+        clean_classes = self._clean_classes
 
         # Classes with mixed filing bases (classic division trigger)
-        use_based = [c for c in self.classes if c.is_use_based()]
-        intent_to_use = [c for c in self.classes if c.is_intent_to_use()]
+        use_based = self._use_based_classes
+        intent_to_use = self._itu_classes
 
         # ── Case 1: Specific division requested by applicant ──────────────────
         if self.ctx.division_requested:
             to_divide = self.ctx.classes_to_divide_out
+            to_divide_set = frozenset(to_divide)
             remaining = [c.class_number for c in self.classes
-                        if c.class_number not in to_divide]
+                        if c.class_number not in to_divide_set]
 
             # Verify divided classes meet standalone requirements
             for cls_num in to_divide:
-                cls = next((c for c in self.classes if c.class_number == cls_num), None)
-                if not cls:
+                cls = self._classes_by_num.get(cls_num)
+                if cls is None:
                     continue
 
                 issues = []
@@ -770,9 +993,9 @@ class Pillar3Assessor:
                     issues.append("fee not paid")
 
                 if issues:
-                    self.findings.append(Pillar3Finding(
+                    append(Pillar3Finding(
                         tmep_section=section,
-                        severity="ERROR",
+                        severity=_SEV_ERROR,
                         class_number=cls_num,
                         item=f"Class {cls_num} — Cannot divide: incomplete requirements",
                         finding=f"Class {cls_num} cannot be divided out because it does "
@@ -784,9 +1007,9 @@ class Pillar3Assessor:
                     ))
                 else:
                     division_eligible.append(cls_num)
-                    self.findings.append(Pillar3Finding(
+                    append(Pillar3Finding(
                         tmep_section=section,
-                        severity="OK",
+                        severity=_SEV_OK,
                         class_number=cls_num,
                         item=f"Class {cls_num} — Division eligible",
                         finding=f"Class {cls_num} meets all standalone requirements "
@@ -797,16 +1020,16 @@ class Pillar3Assessor:
                     ))
 
             if remaining:
-                self.findings.append(Pillar3Finding(
+                remaining_str = ", ".join(map(str, sorted(remaining)))
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="INFO",
+                    severity=_SEV_INFO,
                     class_number=0,
-                    item=f"Remaining after division: "
-                         f"Class(es) {', '.join(str(r) for r in sorted(remaining))}",
+                    item=f"Remaining after division: Class(es) {remaining_str}",
                     finding=f"After dividing out Class(es) "
-                             f"{', '.join(str(d) for d in sorted(to_divide))}, "
+                             f"{', '.join(map(str, sorted(to_divide)))}, "
                              f"the parent application retains "
-                             f"Class(es) {', '.join(str(r) for r in sorted(remaining))}.",
+                             f"Class(es) {remaining_str}.",
                     recommendation="Verify the parent application remains complete "
                                    "and all retained classes are properly supported."
                 ))
@@ -817,21 +1040,23 @@ class Pillar3Assessor:
                 error_cls_nums = [c.class_number for c in error_classes]
                 clean_cls_nums = [c.class_number for c in clean_classes]
                 division_eligible = clean_cls_nums
+                clean_sorted = sorted(clean_cls_nums)
+                error_classes_str = ", ".join([f"Class {n}" for n in sorted(error_cls_nums)])
 
-                self.findings.append(Pillar3Finding(
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="WARNING",
+                    severity=_SEV_WARNING,
                     class_number=0,
                     item=f"Division RECOMMENDED — Clean vs. problem classes detected",
                     finding=f"DIVISION ANALYSIS (§1403.03): "
-                             f"Class(es) {', '.join(f'Class {n}' for n in sorted(clean_cls_nums))} "
+                             f"Class(es) {', '.join([f'Class {n}' for n in clean_sorted])} "
                              f"are clean, but "
-                             f"Class(es) {', '.join(f'Class {n}' for n in sorted(error_cls_nums))} "
+                             f"Class(es) {error_classes_str} "
                              f"have errors. Without division, the errors in "
-                             f"{', '.join(f'Class {n}' for n in sorted(error_cls_nums))} "
+                             f"{error_classes_str} "
                              "will delay registration for the clean classes too.",
                     recommendation=f"Consider dividing Class(es) "
-                                   f"{', '.join(str(n) for n in sorted(clean_cls_nums))} "
+                                   f"{', '.join(map(str, clean_sorted))} "
                                    "into a separate application so they can proceed to "
                                    "registration independently. "
                                    "File a Request to Divide (USPTO Form PTO-2302)."
@@ -840,30 +1065,31 @@ class Pillar3Assessor:
             elif use_based and intent_to_use:
                 itu_nums = [c.class_number for c in intent_to_use]
                 use_nums = [c.class_number for c in use_based]
+                use_str = ", ".join(map(str, sorted(use_nums)))
 
-                self.findings.append(Pillar3Finding(
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="INFO",
+                    severity=_SEV_INFO,
                     class_number=0,
                     item=f"Mixed filing basis — potential division candidate",
                     finding=f"Application has mixed filing bases: "
-                             f"Class(es) {', '.join(str(n) for n in sorted(use_nums))} "
+                             f"Class(es) {use_str} "
                              f"are §1(a) use-based; "
-                             f"Class(es) {', '.join(str(n) for n in sorted(itu_nums))} "
+                             f"Class(es) {', '.join(map(str, sorted(itu_nums)))} "
                              "are §1(b) intent-to-use. "
                              "The §1(b) classes cannot achieve registration until a "
                              "Statement of Use is filed, which may delay the §1(a) classes.",
                     recommendation=f"Consider dividing the §1(a) classes "
-                                   f"({', '.join(str(n) for n in sorted(use_nums))}) "
+                                   f"({use_str}) "
                                    "so they can proceed to registration independently "
                                    "of the §1(b) classes."
                 ))
                 division_eligible = use_nums
 
             else:
-                self.findings.append(Pillar3Finding(
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="INFO",
+                    severity=_SEV_INFO,
                     class_number=0,
                     item="Division not currently indicated",
                     finding="All classes appear to be at the same stage with similar "
@@ -891,53 +1117,60 @@ class Pillar3Assessor:
 
         Returns: (refusal_class_numbers, refusal_reasons_dict)
         """
-        section = "§1403.04"
+        section = _SEC_1403_04
         refusal_classes = []
         refusal_reasons: Dict[int, str] = {}
 
+        append = self.findings.append
         for cls in self.classes:
+            # Fields read several times below — bound to locals once per class
+            cnum = cls.class_number
+            p1n = cls.p1_error_count
+            p2n = cls.p2_error_count
+            p2def = cls.p2_is_definite
             reasons = []
 
             # ── Collect P1 error reasons ──────────────────────────────────────
-            if cls.p1_error_count > 0:
+            if p1n > 0:
                 for msg in cls.p1_error_messages[:2]:
-                    reasons.append(f"[Pillar 1 — §1401] {msg[:100]}")
+                    reasons.append(f"[Pillar 1 — §1401] {msg}")
 
             # ── Collect P2 error reasons ──────────────────────────────────────
-            if not cls.p2_is_definite or cls.p2_error_count > 0:
-                for msg in cls.p2_error_messages[:2]:
-                    reasons.append(f"[Pillar 2 — §1402] {msg[:100]}")
-                if not cls.p2_is_definite and not cls.p2_error_messages:
+            if not p2def or p2n > 0:
+                p2msgs = cls.p2_error_messages
+                for msg in p2msgs[:2]:
+                    reasons.append(f"[Pillar 2 — §1402] {msg}")
+                if not p2def and not p2msgs:
                     reasons.append("[Pillar 2 — §1402] Identification is not sufficiently definite.")
 
             if reasons:
-                refusal_classes.append(cls.class_number)
-                refusal_reasons[cls.class_number] = "; ".join(reasons)
+                refusal_classes.append(cnum)
+                refusal_reasons[cnum] = "; ".join(reasons)
 
-                severity = "ERROR" if cls.status == ClassStatus.REFUSAL_CANDIDATE else "WARNING"
-                self.findings.append(Pillar3Finding(
+                severity = _SEV_ERROR if cls.status == ClassStatus.REFUSAL_CANDIDATE else _SEV_WARNING
+                append(Pillar3Finding(
                     tmep_section=section,
                     severity=severity,
-                    class_number=cls.class_number,
-                    item=f"Class {cls.class_number} — PARTIAL REFUSAL CANDIDATE",
-                    finding=f"Class {cls.class_number} ({cls.class_title}) has "
-                             f"{cls.p1_error_count} Pillar 1 error(s) and "
-                             f"{cls.p2_error_count} Pillar 2 error(s) that constitute "
+                    class_number=cnum,
+                    item=f"Class {cnum} — PARTIAL REFUSAL CANDIDATE",
+                    finding=f"Class {cnum} ({cls.class_title}) has "
+                             f"{p1n} Pillar 1 error(s) and "
+                             f"{p2n} Pillar 2 error(s) that constitute "
                              f"grounds for a PARTIAL REFUSAL under §1403.04. "
                              f"Reasons: {'; '.join(reasons[:2])}",
-                    recommendation=f"Issue a partial refusal limited to Class {cls.class_number}. "
+                    recommendation=f"Issue a partial refusal limited to Class {cnum}. "
                                    "Do NOT refuse the entire application — other classes "
                                    "should continue to be processed. "
                                    "State each ground of refusal clearly in the Office Action.",
-                    triggered_by=f"P1:{cls.p1_error_count}errors + P2:{cls.p2_error_count}errors"
+                    triggered_by=f"P1:{p1n}errors + P2:{p2n}errors"
                 ))
             else:
-                self.findings.append(Pillar3Finding(
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="OK",
-                    class_number=cls.class_number,
-                    item=f"Class {cls.class_number} — No refusal grounds",
-                    finding=f"Class {cls.class_number} ({cls.class_title}) has no "
+                    severity=_SEV_OK,
+                    class_number=cnum,
+                    item=f"Class {cnum} — No refusal grounds",
+                    finding=f"Class {cnum} ({cls.class_title}) has no "
                              "errors from Pillar 1 or Pillar 2. No refusal is indicated "
                              "for this class.",
                     recommendation="This class may proceed independently. "
@@ -946,17 +1179,18 @@ class Pillar3Assessor:
 
         # ── Application-level refusal summary ────────────────────────────────
         if refusal_classes:
+            refusal_set = frozenset(refusal_classes)
             non_refusal = [c.class_number for c in self.classes
-                          if c.class_number not in refusal_classes]
-            self.findings.append(Pillar3Finding(
+                          if c.class_number not in refusal_set]
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="INFO",
+                severity=_SEV_INFO,
                 class_number=0,
                 item=f"Partial refusal summary",
                 finding=f"PARTIAL REFUSAL applies to: "
-                         f"Class(es) {', '.join(str(c) for c in sorted(refusal_classes))}. "
+                         f"Class(es) {', '.join(map(str, sorted(refusal_classes)))}. "
                          f"Classes NOT subject to refusal: "
-                         f"{', '.join(str(c) for c in sorted(non_refusal)) if non_refusal else 'None'}.",
+                         f"{', '.join(map(str, sorted(non_refusal))) if non_refusal else 'None'}.",
                 recommendation="Issue Office Action with partial refusal. "
                                "For each refused class, cite the specific legal ground. "
                                "For clean classes, note they are approved or being processed."
@@ -974,17 +1208,18 @@ class Pillar3Assessor:
         filed in a multi-class application, the correct per-class fee must
         accompany actions for each affected class.
         """
-        section = "§1403.05"
-        stage = self.ctx.application_stage
-        action = self.ctx.post_filing_action_type
-        fee_per_class = self.USPTO_FEES.get(self.ctx.filing_type, 350)
+        section = _SEC_1403_05
+        append = self.findings.append
+        ctx = self.ctx
+        stage = ctx.application_stage
+        action = ctx.post_filing_action_type
 
         # No post-filing action in this assessment
         if not action and stage in (ApplicationStage.PRE_FILING,
                                      ApplicationStage.FILED_PENDING):
-            self.findings.append(Pillar3Finding(
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="INFO",
+                severity=_SEV_INFO,
                 class_number=0,
                 item="No post-filing action in this assessment",
                 finding="Application is at filing/pending stage. "
@@ -996,18 +1231,18 @@ class Pillar3Assessor:
             return
 
         # Statement of Use (SOU) — intent-to-use classes
-        itu_classes = [c for c in self.classes if c.is_intent_to_use()]
+        itu_classes = self._itu_classes   # from run_full_assessment()
         if stage == ApplicationStage.STATEMENT_OF_USE or action == "sou":
             if itu_classes:
                 sou_fee_total = len(itu_classes) * 100  # $100/class SOU fee (USPTO 2025)
-                self.findings.append(Pillar3Finding(
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="INFO",
+                    severity=_SEV_INFO,
                     class_number=0,
                     item=f"Statement of Use — {len(itu_classes)} class(es)",
                     finding=f"Statement of Use being filed for "
                              f"{len(itu_classes)} §1(b) class(es): "
-                             f"{', '.join(f'Class {c.class_number}' for c in itu_classes)}. "
+                             f"{', '.join([f'Class {c.class_number}' for c in itu_classes])}. "
                              f"SOU fee: $100/class × {len(itu_classes)} = ${sou_fee_total}.",
                     recommendation=f"Submit SOU with ${sou_fee_total} total "
                                    f"(${100}/class for each of the "
@@ -1016,17 +1251,17 @@ class Pillar3Assessor:
                 ))
 
         # Amendment response with fees
-        if action in ("amendment", "response") and self.ctx.amendment_affects_classes:
-            affected_count = len(self.ctx.amendment_affects_classes)
-            self.findings.append(Pillar3Finding(
+        if action in ("amendment", "response") and ctx.amendment_affects_classes:
+            affected_count = len(ctx.amendment_affects_classes)
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="INFO",
+                severity=_SEV_INFO,
                 class_number=0,
                 item=f"Post-filing {action} fee — "
                      f"{affected_count} class(es) affected",
                 finding=f"Post-filing {action} affects "
                          f"{affected_count} class(es): "
-                         f"{', '.join(f'Class {c}' for c in sorted(self.ctx.amendment_affects_classes))}. "
+                         f"{', '.join([f'Class {c}' for c in sorted(ctx.amendment_affects_classes)])}. "
                          "Verify whether additional per-class fees are required "
                          "for this type of action.",
                 recommendation=f"Check USPTO fee schedule for post-filing {action} fees. "
@@ -1035,13 +1270,13 @@ class Pillar3Assessor:
             ))
 
         # Surrender fees (if applicable)
-        if self.ctx.surrender_requested and self.ctx.classes_to_surrender:
-            self.findings.append(Pillar3Finding(
+        if ctx.surrender_requested and ctx.classes_to_surrender:
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="INFO",
+                severity=_SEV_INFO,
                 class_number=0,
                 item=f"Surrender fee check — "
-                     f"Class(es) {', '.join(str(c) for c in self.ctx.classes_to_surrender)}",
+                     f"Class(es) {', '.join(map(str, ctx.classes_to_surrender))}",
                 finding="Partial surrender of classes in a multi-class registration. "
                          "Verify whether any petition or maintenance fees apply "
                          "to the surrender action.",
@@ -1050,9 +1285,9 @@ class Pillar3Assessor:
             ))
 
         # General multi-class post-filing reminder
-        self.findings.append(Pillar3Finding(
+        append(Pillar3Finding(
             tmep_section=section,
-            severity="INFO",
+            severity=_SEV_INFO,
             class_number=0,
             item="Multi-class post-filing fee rule",
             finding="Per §1403.05: in multi-class applications, post-filing actions "
@@ -1072,15 +1307,16 @@ class Pillar3Assessor:
         classes while keeping others. Checks that surrendering a class doesn't
         create scope inconsistencies in the remaining classes.
         """
-        section = "§1403.06"
+        section = _SEC_1403_06
+        append = self.findings.append
         stage = self.ctx.application_stage
 
         # Only relevant post-registration
         if stage not in (ApplicationStage.REGISTERED,
                           ApplicationStage.POST_REGISTRATION):
-            self.findings.append(Pillar3Finding(
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="INFO",
+                severity=_SEV_INFO,
                 class_number=0,
                 item=f"§1403.06 — Not yet registered (stage: {stage.value})",
                 finding="Application has not yet reached registration. "
@@ -1092,9 +1328,9 @@ class Pillar3Assessor:
             return
 
         if not self.ctx.surrender_requested:
-            self.findings.append(Pillar3Finding(
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="INFO",
+                severity=_SEV_INFO,
                 class_number=0,
                 item="No surrender requested",
                 finding="No surrender of classes has been requested in this assessment.",
@@ -1106,14 +1342,12 @@ class Pillar3Assessor:
             return
 
         to_surrender = self.ctx.classes_to_surrender
-        to_retain = [c for c in self.classes
-                     if c.class_number not in to_surrender]
 
         # ── Validate surrender doesn't leave registration empty ───────────────
         if len(to_surrender) >= len(self.classes):
-            self.findings.append(Pillar3Finding(
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="ERROR",
+                severity=_SEV_ERROR,
                 class_number=0,
                 item="Full surrender — entire registration would be abandoned",
                 finding="Surrendering all classes would result in complete abandonment "
@@ -1126,33 +1360,37 @@ class Pillar3Assessor:
             return
 
         # ── Check for scope inconsistencies in retained classes ───────────────
-        surrendered_cls_objects = [c for c in self.classes
-                                   if c.class_number in to_surrender]
-        retained_id_words = set()
-        for rc in to_retain:
-            retained_id_words.update(rc.identification.lower().split())
+        # (partitioned only now — the full-surrender guard above needs neither)
+        to_surrender_set = frozenset(to_surrender)
+        to_retain, surrendered_cls_objects = [], []
+        for c in self.classes:
+            (surrendered_cls_objects if c.class_number in to_surrender_set
+             else to_retain).append(c)
+        retained_id_words = frozenset(chain.from_iterable(
+            rc.identification_words() for rc in to_retain))
 
         inconsistency_found = False
         for sc in surrendered_cls_objects:
-            surrendered_words = set(sc.identification.lower().split()) - {
-                "and", "or", "for", "the", "of", "in", "a", "an", "to",
-                "with", "by", "from", "on", "at", "namely", "including"
-            }
-            overlap_with_retained = surrendered_words & retained_id_words
-            significant_overlap = [w for w in overlap_with_retained if len(w) > 4]
+            # Only existence and the first 5 shared long words are used, so test
+            # the surrendered words one by one and stop at 5 — no intersection
+            # or stopword-difference set is built
+            significant_overlap = list(islice(
+                (w for w in sc.identification_words()
+                 if len(w) > 4 and w in retained_id_words
+                 and w not in _SURRENDER_STOPWORDS), 5))
 
             if significant_overlap:
                 inconsistency_found = True
-                self.findings.append(Pillar3Finding(
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="WARNING",
+                    severity=_SEV_WARNING,
                     class_number=sc.class_number,
                     item=f"Scope overlap: surrendering Class {sc.class_number} "
                          f"while retaining other classes",
                     finding=f"Surrendering Class {sc.class_number} ({sc.class_title}) "
                              f"may create inconsistency with retained classes. "
                              f"Shared terminology between surrendered and retained "
-                             f"identifications: {', '.join(significant_overlap[:5])}. "
+                             f"identifications: {', '.join(significant_overlap)}. "
                              "After surrender, consumers may be confused about the "
                              "scope of the remaining registration.",
                     recommendation=f"Review whether surrendering Class {sc.class_number} "
@@ -1161,9 +1399,9 @@ class Pillar3Assessor:
                                    "are needed for clarity post-surrender."
                 ))
             else:
-                self.findings.append(Pillar3Finding(
+                append(Pillar3Finding(
                     tmep_section=section,
-                    severity="OK",
+                    severity=_SEV_OK,
                     class_number=sc.class_number,
                     item=f"Class {sc.class_number} — Surrender scope check",
                     finding=f"Surrendering Class {sc.class_number} ({sc.class_title}) "
@@ -1174,16 +1412,16 @@ class Pillar3Assessor:
 
         # ── Retained classes check ────────────────────────────────────────────
         if to_retain:
-            self.findings.append(Pillar3Finding(
+            retained_str = ", ".join(map(str, sorted([c.class_number for c in to_retain])))
+            append(Pillar3Finding(
                 tmep_section=section,
-                severity="INFO",
+                severity=_SEV_INFO,
                 class_number=0,
-                item=f"Post-surrender retained: "
-                     f"Class(es) {', '.join(str(c.class_number) for c in sorted(to_retain, key=lambda x: x.class_number))}",
+                item=f"Post-surrender retained: Class(es) {retained_str}",
                 finding=f"After surrendering Class(es) "
-                         f"{', '.join(str(s) for s in sorted(to_surrender))}, "
+                         f"{', '.join(map(str, sorted(to_surrender)))}, "
                          f"the registration will retain "
-                         f"Class(es) {', '.join(str(c.class_number) for c in sorted(to_retain, key=lambda x: x.class_number))}.",
+                         f"Class(es) {retained_str}.",
                 recommendation="Ensure maintenance fees (Section 8/71 Declarations) "
                                "are paid for all RETAINED classes going forward. "
                                "Surrendered classes are excluded from future maintenance."
@@ -1198,8 +1436,14 @@ class Pillar3Assessor:
                       refusal_classes: List[int],
                       refusal_reasons: Dict[int, str]) -> Pillar3AssessmentResult:
 
-        errors = sum(1 for f in self.findings if f.severity == "ERROR")
-        warnings = sum(1 for f in self.findings if f.severity == "WARNING")
+        # Single pass over the findings for both severity tallies
+        errors = warnings = 0
+        for f in self.findings:
+            sev = f.severity
+            if sev is _SEV_ERROR:
+                errors += 1
+            elif sev is _SEV_WARNING:
+                warnings += 1
         is_compliant = (errors == 0)
 
         return Pillar3AssessmentResult(
@@ -1218,59 +1462,79 @@ class Pillar3Assessor:
 # REPORT GENERATOR
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_SEVERITY_SYMBOLS = {_SEV_ERROR: "■", _SEV_WARNING: "▲", _SEV_INFO: "◆", _SEV_OK: "✓"}
+_SEVERITY_ORDER = {_SEV_ERROR: 0, _SEV_WARNING: 1, _SEV_INFO: 2, _SEV_OK: 3}
+_ACTIONABLE = (_SEV_ERROR, _SEV_WARNING)
+_REPORT_RULE = "─" * 70
+
+
+def _trim(t, n=110):
+    if not isinstance(t, str):
+        t = str(t)
+    if "\n" in t:
+        t = t.replace("\n", " ")
+    t = t.strip()
+    if len(t) <= n:
+        return t
+    cut = t.rfind(" ", 0, n)     # last word break inside the limit
+    return t[:cut if cut > 0 else n] + "…"
+
+
 def print_pillar3_report(result: Pillar3AssessmentResult,
                           app_context: MultiClassApplicationContext):
     """Professional legal report — Pillar 3 multi-class filing assessment."""
-    _SEV   = {"ERROR": "■", "WARNING": "▲", "INFO": "◆", "OK": "✓"}
-    _ORDER = {"ERROR": 0, "WARNING": 1, "INFO": 2, "OK": 3}
-
-    def _trim(t, n=110):
-        t = str(t).replace("\n", " ").strip()
-        return t if len(t) <= n else t[:n].rsplit(" ", 1)[0] + "…"
+    out = []
+    w = out.append      # lines are buffered and written to stdout once
 
-    line   = "─" * 70
+    line   = _REPORT_RULE
     status = "COMPLIANT" if result.is_multi_class_compliant \
              else "NON-COMPLIANT — CORRECTIONS REQUIRED"
 
-    print(f"\n{line}")
-    print(f"  MULTI-CLASS FILING REVIEW  |  §1403")
-    print(f"  Status: {status}")
+    w(f"\n{line}")
+    w(f"  MULTI-CLASS FILING REVIEW  |  §1403")
+    w(f"  Status: {status}")
 
     # ── Partial refusal alert (high legal significance — always show) ─────────
     if result.partial_refusal_classes:
-        cls_list = ", ".join(f"Class {c}" for c in sorted(result.partial_refusal_classes))
-        print(f"\n  PARTIAL REFUSAL INDICATED:  {cls_list}")
+        cls_list = ", ".join([f"Class {c}" for c in sorted(result.partial_refusal_classes)])
+        w(f"\n  PARTIAL REFUSAL INDICATED:  {cls_list}")
         for cls_num, reason in result.partial_refusal_reasons.items():
-            print(f"    Class {cls_num}: {_trim(reason, 100)}")
+            w(f"    Class {cls_num}: {_trim(reason, 100)}")
 
     # ── Division recommendation (material to applicant strategy) ─────────────
     if result.division_recommended:
-        eligible = ", ".join(f"Class {c}" for c in sorted(result.division_eligible_classes))
-        print(f"\n  DIVISION RECOMMENDED")
-        print(f"  Classes eligible to proceed independently: {eligible}")
+        eligible = ", ".join([f"Class {c}" for c in sorted(result.division_eligible_classes)])
+        w(f"\n  DIVISION RECOMMENDED")
+        w(f"  Classes eligible to proceed independently: {eligible}")
 
     # ── Actionable findings only — no OK, no pure INFO ────────────────────────
-    issues = sorted(
-        [f for f in result.findings if f.severity in ("ERROR", "WARNING")],
-        key=lambda x: (_ORDER.get(x.severity, 9), x.class_number)
-    )
+    # One line per (section, class, severity): duplicates are dropped while
+    # filtering (first one wins, as the sort below is stable on the same key),
+    # so only the survivors are sorted. Sort keys are computed once.
+    seen = set()
+    issues = []
+    for f in result.findings:
+        if f.severity not in _ACTIONABLE:
+            continue
+        key = (f.tmep_section, f.class_number, f.severity)
+        if key in seen:
+            continue
+        seen.add(key)
+        issues.append(((_SEVERITY_ORDER.get(f.severity, 9), f.class_number), f))
+    issues.sort(key=itemgetter(0))
 
     if issues:
-        print(f"\n  Filing Issues:")
-        seen = set()
-        for f in issues:
-            key = (f.tmep_section, f.class_number, f.severity)
-            if key in seen:
-                continue
-            seen.add(key)
-            sym = _SEV.get(f.severity, "?")
+        w(f"\n  Filing Issues:")
+        for _, f in issues:
+            sym = _SEVERITY_SYMBOLS.get(f.severity, "?")
             cls = f"Class {f.class_number}: " if f.class_number > 0 else ""
-            print(f"  {sym} [{f.tmep_section}]  {cls}{_trim(f.finding)}")
-            print(f"      → {_trim(f.recommendation)}")
+            w(f"  {sym} [{f.tmep_section}]  {cls}{_trim(f.finding)}")
+            w(f"      → {_trim(f.recommendation)}")
     else:
-        print(f"\n  No multi-class filing issues detected.")
+        w(f"\n  No multi-class filing issues detected.")
 
-    print(line)
+    w(line)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1279,7 +1543,8 @@ def print_pillar3_report(result: Pillar3AssessmentResult,
 
 def assess_multi_class_application(
         class_summaries: List[ClassSummary],
-        app_context: MultiClassApplicationContext
+        app_context: MultiClassApplicationContext,
+        verbose_ok: bool = True
 ) -> Pillar3AssessmentResult:
     """
     Main entry point for Pillar 3 assessment.
@@ -1288,11 +1553,12 @@ def assess_multi_class_application(
         class_summaries : List of ClassSummary built via build_class_summary()
                           — one per class, each incorporating P1 + P2 findings
         app_context     : MultiClassApplicationContext with application-level data
+        verbose_ok      : False drops the per-class OK/INFO checklist findings
 
     Returns:
         Pillar3AssessmentResult with all §1403 findings
     """
-    assessor = Pillar3Assessor(class_summaries, app_context)
+    assessor = Pillar3Assessor(class_summaries, app_context, verbose_ok=verbose_ok)
     return assessor.run_full_assessment()
 
 
@@ -1315,43 +1581,37 @@ def run_full_pipeline(application_dict: dict) -> dict:
             summary  : Combined counts across all 3 pillars
     """
     # ── PILLAR 1 ──────────────────────────────────────────────────────────────
-    try:
-        from main import assess_trademark_application
-        p1_result = assess_trademark_application(application_dict)
+    if _assess_pillar1 is not None:
+        p1_result = _assess_pillar1(application_dict)
         p1_findings = p1_result["findings"]
         p1_app = p1_result["application"]
-    except ImportError:
+    else:
         print("⚠️  Pillar 1 (main.py) not found — running Pillar 3 with provided data only.")
         p1_findings = []
         p1_app = None
 
-    # ── PILLAR 2 (per class) ──────────────────────────────────────────────────
-    p2_results: Dict[int, dict] = {}
-    try:
-        from tmep_1402_pillar2 import (
-            analyze_identification_under_tmep_1402,
-            build_pillar1_context_from_dicts,
-            Pillar1ClassContext
-        )
-        for cls_dict in application_dict.get("classes", []):
-            cls_num = int(cls_dict.get("class_number", 0))
-            p1_ctx = build_pillar1_context_from_dicts(cls_dict, p1_findings)
-            p2_result = analyze_identification_under_tmep_1402(
-                cls_dict.get("identification", ""),
-                pillar1_context=p1_ctx
-            )
-            p2_results[cls_num] = p2_result
-    except ImportError:
+    # ── PILLAR 2 (per class) + CLASS SUMMARIES (P1 + P2 consolidated) ─────────
+    # One pass over the classes: each class's P2 result feeds its summary
+    # directly.
+    if _analyze_pillar2 is None:
         print("⚠️  Pillar 2 (tmep_1402_pillar2.py) not found — skipping P2 analysis.")
 
-    # ── BUILD CLASS SUMMARIES (P1 + P2 consolidated) ──────────────────────────
+    p2_results: Dict[int, dict] = {}
+    p1_buckets = bucket_p1_findings(p1_findings)
     class_summaries = []
-    for cls_dict in application_dict.get("classes", []):
+    for cls_dict in application_dict.get("classes", ()):
         cls_num = int(cls_dict.get("class_number", 0))
+        if _analyze_pillar2 is not None:
+            p1_ctx = _build_p1_context(cls_dict, p1_findings)
+            p2_results[cls_num] = _analyze_pillar2(
+                cls_dict.get("identification", ""),
+                pillar1_context=p1_ctx
+            )
         summary = build_class_summary(
             class_entry_dict=cls_dict,
             p1_findings=p1_findings,
-            p2_result_dict=p2_results.get(cls_num)
+            p2_result_dict=p2_results.get(cls_num),
+            p1_buckets=p1_buckets
         )
         class_summaries.append(summary)
 
@@ -1365,12 +1625,12 @@ def run_full_pipeline(application_dict: dict) -> dict:
         total_fee_paid=float(application_dict.get("total_fee_paid", 0.0)),
         application_stage=ApplicationStage.FILED_PENDING,
         amendment_requested=application_dict.get("amendment_requested", False),
-        amendment_affects_classes=application_dict.get("amendment_affects_classes", []),
+        amendment_affects_classes=application_dict.get("amendment_affects_classes", ()),
         amendment_description=application_dict.get("amendment_description", ""),
         division_requested=application_dict.get("division_requested", False),
-        classes_to_divide_out=application_dict.get("classes_to_divide_out", []),
+        classes_to_divide_out=application_dict.get("classes_to_divide_out", ()),
         surrender_requested=application_dict.get("surrender_requested", False),
-        classes_to_surrender=application_dict.get("classes_to_surrender", []),
+        classes_to_surrender=application_dict.get("classes_to_surrender", ()),
         post_filing_action_type=application_dict.get("post_filing_action_type", "")
     )
 
@@ -1379,22 +1639,31 @@ def run_full_pipeline(application_dict: dict) -> dict:
 
     # ── COMBINED SUMMARY ──────────────────────────────────────────────────────
     p1_summary = p1_result.get("summary", {}) if p1_findings else {}
-    p2_total_errors = sum(r["summary"]["errors"] for r in p2_results.values())
-    p2_total_warnings = sum(r["summary"]["warnings"] for r in p2_results.values())
-
+    p2_total_errors = p2_total_warnings = 0
+    for r in p2_results.values():
+        s = r["summary"]
+        p2_total_errors += s["errors"]
+        p2_total_warnings += s["warnings"]
+    p1_errors = p1_summary.get("errors", 0)
+    p1_warnings = p1_summary.get("warnings", 0)
+    p3_errors = p3_result.total_errors
+    p3_warnings = p3_result.total_warnings
+
+    # Compliance counts P1 + P3 errors only; P2 errors are reported, not
+    # gating (is_multi_class_compliant is just p3_errors == 0).
     combined_summary = {
-        "pillar1_errors":   p1_summary.get("errors", 0),
-        "pillar1_warnings": p1_summary.get("warnings", 0),
+        "pillar1_errors":   p1_errors,
+        "pillar1_warnings": p1_warnings,
         "pillar2_errors":   p2_total_errors,
         "pillar2_warnings": p2_total_warnings,
-        "pillar3_errors":   p3_result.total_errors,
-        "pillar3_warnings": p3_result.total_warnings,
-        "total_errors":     p1_summary.get("errors", 0) + p2_total_errors + p3_result.total_errors,
-        "total_warnings":   p1_summary.get("warnings", 0) + p2_total_warnings + p3_result.total_warnings,
+        "pillar3_errors":   p3_errors,
+        "pillar3_warnings": p3_warnings,
+        "total_errors":     p1_errors + p2_total_errors + p3_errors,
+        "total_warnings":   p1_warnings + p2_total_warnings + p3_warnings,
         "partial_refusal_classes": p3_result.partial_refusal_classes,
         "division_recommended": p3_result.division_recommended,
         "division_eligible_classes": p3_result.division_eligible_classes,
-        "overall_compliant": p3_result.is_multi_class_compliant and p1_summary.get("errors", 0) == 0
+        "overall_compliant": p1_errors + p3_errors == 0
     }
 
     print_pillar3_report(p3_result, app_ctx)
@@ -1485,7 +1754,7 @@ if __name__ == "__main__":
         "fees_paid_count": 3,
         "total_fee_paid": 750.0,
         "amendment_requested": True,
-        "amendment_affects_classes": [9],         # Only Class 9 amended
+        "amendment_affects_classes": (9,),        # Only Class 9 amended
         "amendment_description": "clarify software identification",
         "division_requested": False,
         "surrender_requested": False,